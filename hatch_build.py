@@ -0,0 +1,54 @@
+"""Hatch build hook that generates the pre-compiled font pack and the font metadata index
+(src/textual_pyfiglet/fonts.pack and fonts.index).
+
+They are not checked in to git, so a clean checkout does not have them. This hook builds
+them from the Pyfiglet of the build environment before every build, so released wheels and
+sdists always include them, and checks that the built wheel does contain them."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import sys
+import zipfile
+from pathlib import Path
+from typing import Any
+
+# Other library imports
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+GENERATED_FILES = ("fonts.pack", "fonts.index")
+"The files generated in the package directory, which every wheel must contain."
+
+
+class FontDataBuildHook(BuildHookInterface):  # type: ignore[type-arg]
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+
+        package_dir = Path(self.root, "src", "textual_pyfiglet")
+        if version == "editable" and all((package_dir / name).exists() for name in GENERATED_FILES):
+            return  # Editable installs only need them once, `just make-list` updates them.
+
+        sys.path.insert(0, str(package_dir.parent))
+        try:
+            from textual_pyfiglet.font_index import build_index
+            from textual_pyfiglet.font_pack import build_pack
+
+            font_count = build_pack(package_dir / "fonts.pack")
+            build_index(package_dir / "fonts.index")
+        finally:
+            sys.path.remove(str(package_dir.parent))
+        self.app.display_info(f"Wrote the font pack and font index of {font_count} fonts to {package_dir}")
+
+    def finalize(self, version: str, build_data: dict[str, Any], artifact_path: str) -> None:
+
+        if self.target_name != "wheel" or version == "editable":
+            return
+        with zipfile.ZipFile(artifact_path) as wheel:
+            names = set(wheel.namelist())
+        missing = [name for name in GENERATED_FILES if f"textual_pyfiglet/{name}" not in names]
+        if missing:
+            raise RuntimeError(f"The wheel is missing the generated files: {', '.join(missing)}")
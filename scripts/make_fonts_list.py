@@ -1,8 +1,13 @@
 # This file is used to generate a list of all available fonts
 # in the rich_pyfiglet.pyfiglet.fonts module.
+# It also compiles all of the fonts into the pre-parsed font pack
+# (src/textual_pyfiglet/fonts.pack), and writes the font metadata index
+# (src/textual_pyfiglet/fonts.index). See font_pack.py and font_index.py for details.
 
 import os
 from pyfiglet import fonts
+from textual_pyfiglet.font_pack import build_pack
+from textual_pyfiglet.font_index import build_index
 
 ext_fonts_pkg = os.path.dirname(fonts.__file__)
 
@@ -15,6 +20,8 @@ for root, dirs, files in os.walk(ext_fonts_pkg):
 
 all_files = sorted(all_files)
 
+font_names: list[str] = []
+
 # write all_files out to a file:
 with open("src/textual_pyfiglet/fonts_list.py", "w") as f:
     f.write("from typing import Literal \n\n")
@@ -24,4 +31,11 @@ with open("src/textual_pyfiglet/fonts_list.py", "w") as f:
             # remove the extension
             font_name = file[:-4]
             f.write(f'"{font_name}",\n')
+            font_names.append(font_name)
     f.write("]\n")
+
+font_count = build_pack("src/textual_pyfiglet/fonts.pack", fonts=font_names)
+print(f"Wrote {font_count} fonts to src/textual_pyfiglet/fonts.pack")
+
+font_count = build_index("src/textual_pyfiglet/fonts.index", fonts=font_names)
+print(f"Wrote the metadata of {font_count} fonts to src/textual_pyfiglet/fonts.index")
@@ -6,6 +6,14 @@ To import:
 from textual_pyfiglet import FigletWidget
 ```
 
+Importing the package is cheap: Textual is only imported the first time `FigletWidget`
+is accessed. If you only need to render figlets (in a CLI tool, for instance), the
+standalone render functions do not need Textual at all:
+```
+from textual_pyfiglet import figlet_quick, render_lines
+from textual_pyfiglet.measure import measure
+```
+
 You can also import the original PyFiglet.
 ```
 # Class version:
@@ -21,6 +29,40 @@ Package standards:
 - Formatting - Black - max 110 characters / line
 """
 
-from textual_pyfiglet.figletwidget import FigletWidget
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from textual_pyfiglet.figletwidget import FigletWidget
+    from textual_pyfiglet.measure import Measurement
+    from textual_pyfiglet.renderer import figlet_quick, render_lines, render_lines_async
+
+__all__ = ["FigletWidget", "Measurement", "figlet_quick", "render_lines", "render_lines_async"]
+
+_LAZY_IMPORTS = {
+    "FigletWidget": "textual_pyfiglet.figletwidget",
+    "Measurement": "textual_pyfiglet.measure",
+    "figlet_quick": "textual_pyfiglet.renderer",
+    "render_lines": "textual_pyfiglet.renderer",
+    "render_lines_async": "textual_pyfiglet.renderer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public API on first access, so that `import textual_pyfiglet`
+    does not import Textual (or Pyfiglet) until it is actually needed."""
+
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # Cache it so __getattr__ is not called again for this name.
+    return value
+
 
-__all__ = ["FigletWidget"]
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,38 @@
+"""Module for `atomic_write`, which the font pack, the font index, the disk render cache
+and the demo's font gallery use to write their files."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write(path: str | os.PathLike[str], data: bytes, mode: int | None = None) -> None:
+    """Write data to a file. It is written to a temporary file in the same directory first
+    and then moved into place, so a reader never sees a half written file. The temporary
+    file name starts with a dot.
+
+    Args:
+        path: The file to write. Its directory must exist.
+        data: The contents of the file.
+        mode: The permissions of the file. If None, the file is only readable and writable
+            by the current user (as created by `tempfile.mkstemp`).
+    Raises:
+        OSError: If the file cannot be written."""
+
+    path = Path(path)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
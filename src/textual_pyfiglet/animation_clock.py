@@ -0,0 +1,121 @@
+"""Module for the AnimationClock class.
+
+Textual gives every widget with `auto_refresh` its own interval timer. With many animated
+FigletWidgets, that is many timers waking up out of phase, and as many separate repaints.
+Instead, every animated FigletWidget in an app subscribes to the app's AnimationClock.
+The clock has a single timer, and on each tick it advances every widget that is due, in a
+single batch, so the screen is repainted once.
+
+The clock ticks at the least common multiple of the frame rates of its widgets (rounded
+to whole frames per second), so that every widget advances once every N ticks, for a
+whole number N. If that would be faster than `MAX_TICK_FPS`, the clock ticks at
+`MAX_TICK_FPS` and the frame rates are rounded to the nearest divisor."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import math
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary, ref
+
+if TYPE_CHECKING:
+    from textual.app import App
+    from textual.timer import Timer
+    from textual.widget import Widget
+
+MAX_TICK_FPS = 60
+
+_clocks: WeakKeyDictionary[App[Any], AnimationClock] = WeakKeyDictionary()
+
+
+class AnimationClock:
+    """The shared animation timer of an app. Use `AnimationClock.for_app(app)` to get it."""
+
+    def __init__(self, app: App[Any]) -> None:
+        """Create an AnimationClock. The timer starts when the first widget subscribes.
+
+        Args:
+            app: The app that runs the timer."""
+
+        self._app = ref(app)  # The clock is a value in `_clocks`, so it must not keep the app alive.
+        self.tick_fps = 0
+        "How many times per second the clock ticks. 0 when it is stopped."
+        self.ticks = 0
+        "The number of ticks since the clock was created."
+        self._fps: dict[Widget, float] = {}
+        self._divisors: dict[Widget, int] = {}
+        self._timer: Timer | None = None
+
+    @property
+    def app(self) -> App[Any] | None:
+        "The app that runs the timer, or None if it was garbage collected."
+        return self._app()
+
+    @classmethod
+    def for_app(cls, app: App[Any]) -> AnimationClock:
+        """Return the clock of an app, creating it on first use."""
+
+        clock = _clocks.get(app)
+        if clock is None:
+            clock = _clocks[app] = cls(app)
+        return clock
+
+    def subscribe(self, widget: Widget, fps: float) -> None:
+        """Advance a widget `fps` times per second, by calling its `automatic_refresh()`.
+        Subscribing a widget again changes its frame rate.
+
+        Args:
+            widget: The widget to advance.
+            fps: The frame rate of the widget."""
+
+        if fps <= 0:
+            raise ValueError("fps must be greater than 0.")
+        self._fps[widget] = fps
+        self._retime()
+
+    def unsubscribe(self, widget: Widget) -> None:
+        """Stop advancing a widget. The timer stops when no widget is subscribed."""
+
+        if self._fps.pop(widget, None) is not None:
+            self._retime()
+
+    def divisor(self, widget: Widget) -> int | None:
+        """Return how many ticks there are between two frames of a widget, or None if it is
+        not subscribed."""
+
+        return self._divisors.get(widget)
+
+    def _retime(self) -> None:
+
+        rates = [max(1, round(fps)) for fps in self._fps.values()]
+        tick_fps = math.lcm(*rates) if rates else 0
+        if tick_fps > MAX_TICK_FPS:
+            tick_fps = MAX_TICK_FPS
+
+        self._divisors = {widget: max(1, round(tick_fps / fps)) for widget, fps in self._fps.items()}
+        if tick_fps != self.tick_fps:
+            if self._timer is not None:
+                self._timer.stop()
+                self._timer = None
+            app = self.app
+            if tick_fps and app is not None:
+                self._timer = app.set_interval(1 / tick_fps, self.tick, name="figlet animation clock")
+            self.tick_fps = tick_fps
+
+    def tick(self) -> None:
+        """Advance every widget that is due on this tick, and repaint them in one batch."""
+
+        self.ticks += 1
+        due = [widget for widget, divisor in self._divisors.items() if self.ticks % divisor == 0]
+        app = self.app
+        if not due or app is None:
+            return
+        with app.batch_update():
+            for widget in due:
+                if widget.is_attached:
+                    widget.automatic_refresh()
+                else:
+                    self.unsubscribe(widget)  # It was removed without unsubscribing.
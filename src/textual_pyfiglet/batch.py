@@ -0,0 +1,130 @@
+"""Module for rendering many figlets at once, in a pool of processes.
+
+This is for offline / bulk rendering, for instance pre-generating banners for
+static assets. It does not need Textual:
+
+```
+from textual_pyfiglet.batch import render_many
+
+jobs = [(name, font, 80, "left") for name in product_names for font in fonts]
+for banner in render_many(jobs, workers=8):
+    ...
+```
+"""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, Callable, Generator, Iterable, NamedTuple, cast
+
+# Local imports
+from textual_pyfiglet.renderer import JUSTIFY_OPTIONS, figlet_quick
+
+if TYPE_CHECKING:
+    from textual_pyfiglet.fonts_list import ALL_FONTS
+
+
+class RenderJob(NamedTuple):
+    """A single render for `render_many`. Plain (text, font, width, justify) tuples also work."""
+
+    text: str
+    font: str = "standard"
+    width: int = 80
+    justify: str = "left"
+
+
+def render_many(
+    items: Iterable[tuple[str, str, int, str]],
+    workers: int | None = None,
+    chunksize: int | None = None,
+    progress: Callable[[int, int], object] | None = None,
+) -> Generator[str, None, None]:
+    """Render many figlets in a pool of worker processes.
+
+    The jobs are grouped by font before they are sent to the workers, so that every chunk
+    of work only uses a single font, and each worker process only loads a font once.
+    The results are yielded in the same order as the jobs were given, as soon as they
+    are ready. Each result is the same string that `figlet_quick` returns.
+
+    Args:
+        items: The jobs to render, as (text, font, width, justify) tuples or RenderJobs.
+        workers: Number of worker processes. Default is the number of CPUs.
+        chunksize: Number of jobs sent to a worker at a time. Default is chosen so
+            that every worker gets about four chunks.
+        progress: Optional callback. It is called with (jobs done, total jobs)
+            every time a chunk is finished.
+    Raises:
+        ValueError: If workers or chunksize is less than 1. This is raised by the call itself,
+            not when the results are first iterated."""
+
+    jobs = [RenderJob(*item) for item in items]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+    if chunksize is None:
+        chunksize = max(1, -(-len(jobs) // (workers * 4)))  # ceiling division
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1.")
+    return _render_many(jobs, workers, chunksize, progress)
+
+
+def _render_many(
+    jobs: list[RenderJob],
+    workers: int,
+    chunksize: int,
+    progress: Callable[[int, int], object] | None,
+) -> Generator[str, None, None]:
+
+    total = len(jobs)
+    if total == 0:
+        return
+
+    # Group the job indexes by font (in order of first appearance), then cut each group into chunks.
+    by_font: dict[str, list[int]] = {}
+    for index, job in enumerate(jobs):
+        by_font.setdefault(job.font, []).append(index)
+    chunks = [
+        indexes[start : start + chunksize]
+        for indexes in by_font.values()
+        for start in range(0, len(indexes), chunksize)
+    ]
+
+    results: dict[int, str] = {}
+    next_index = 0
+    done = 0
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(chunks)))
+    try:
+        pending: set[Future[list[tuple[int, str]]]] = {
+            executor.submit(_render_chunk, [(index, jobs[index]) for index in chunk]) for chunk in chunks
+        }
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                chunk_results = future.result()
+                results.update(chunk_results)
+                done += len(chunk_results)
+                if progress is not None:
+                    progress(done, total)
+
+            while next_index in results:
+                yield results.pop(next_index)
+                next_index += 1
+    finally:
+        # If the caller stops iterating early, do not wait for the jobs that have not started.
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _render_chunk(chunk: list[tuple[int, RenderJob]]) -> list[tuple[int, str]]:
+
+    results: list[tuple[int, str]] = []
+    for index, job in chunk:
+        font = cast("ALL_FONTS", job.font)
+        justify = cast(JUSTIFY_OPTIONS, job.justify)
+        results.append((index, figlet_quick(job.text, font=font, width=job.width, justify=justify)))
+    return results
@@ -0,0 +1,14 @@
+"""Benchmarks for Textual-PyFiglet.
+
+Each module in this package can be run on its own, for instance:
+```
+python -m textual_pyfiglet.benchmarks.import_time
+```
+
+Or run them all with the `bench` command, which writes the results as JSON and can
+compare them against an earlier run (see `textual_pyfiglet.benchmarks.cli`):
+```
+textual-pyfiglet bench --output baseline.json
+textual-pyfiglet bench --baseline baseline.json
+```
+"""
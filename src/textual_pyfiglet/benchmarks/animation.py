@@ -0,0 +1,82 @@
+"""Benchmark for the cost of animation frames: how long it takes to style every frame of
+an animation cycle, how long it takes to play a frame once the cycle is styled, and how
+many bytes a frame takes when it is sent to the terminal."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import time
+import timeit
+
+# Textual and Rich imports
+from rich.style import Style
+
+# Local imports
+from textual_pyfiglet.renderer import CustomFiglet, trim_render
+from textual_pyfiglet.strips import FrameCycle, frame_bytes
+
+COLORS = tuple(Style(color=f"#{red:02x}40{255 - red:02x}") for red in range(0, 256, 16))
+"The colors of the animations. 16 colors, so a cycle has 16 frames."
+
+ANIMATIONS = {
+    "vertical gradient": ("gradient", False),
+    "horizontal gradient": ("gradient", True),
+    "strobe": ("strobe", False),
+}
+"Maps a description to the animation type and whether the gradient is horizontal."
+
+TEXT = "Hello, World!"
+
+
+def make_lines(width: int = 120) -> list[str]:
+    """Return the trimmed lines of a 'slant' font render of TEXT."""
+
+    figlet = CustomFiglet(font="slant", width=width, justify="center")
+    return trim_render(str(figlet.renderText(TEXT)).splitlines(), True)
+
+
+def run(repeats: int = 5) -> dict[str, float]:
+    """Time the animations in ANIMATIONS. Returns a dict of description to value: the best
+    time to style a whole cycle and to play one frame, in seconds, and the size of the
+    first frame, in bytes.
+
+    Args:
+        repeats: How many times each measurement is timed. The best time is kept."""
+
+    lines = make_lines()
+    width = max(len(line) for line in lines)
+    results: dict[str, float] = {}
+    for name, (animation_type, horizontal) in ANIMATIONS.items():
+        best = float("inf")
+        for _ in range(repeats):
+            cycle = FrameCycle(lines, COLORS, animation_type, horizontal, width)
+            start = time.perf_counter()
+            for phase in range(len(cycle)):
+                cycle.frame(phase)
+            best = min(best, time.perf_counter() - start)
+        results[f"{name}, style cycle (s)"] = best
+
+        cycle = FrameCycle(lines, COLORS, animation_type, horizontal, width)
+        for phase in range(len(cycle)):
+            cycle.frame(phase)  # Style the cycle first, so only playing it is timed.
+        phases = iter(range(10**9))
+        timings = timeit.repeat(lambda: cycle.frame(next(phases)), number=len(COLORS) * 10, repeat=repeats)
+        results[f"{name}, play frame (s)"] = min(timings) / (len(COLORS) * 10)
+        results[f"{name}, frame size (bytes)"] = frame_bytes(cycle.frame(0))
+    return results
+
+
+def main() -> None:
+
+    for name, value in run().items():
+        if name.endswith("(bytes)"):
+            print(f"{name:<45} {value:9.0f} B")
+        else:
+            print(f"{name:<45} {value * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""The `textual-pyfiglet bench` command. Runs the benchmarks of this package, writes
+the results as JSON, and can compare them against the results of an earlier run:
+
+```
+textual-pyfiglet bench --output baseline.json
+textual-pyfiglet bench --baseline baseline.json
+```
+
+Every value is a cost (seconds or bytes), so lower is better. A value that is more than
+`--threshold` higher than in the baseline is reported as a regression, and the command
+exits with status 1."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import argparse
+import json
+import platform
+import sys
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Callable, NamedTuple, Sequence
+
+
+class Suite(NamedTuple):
+    "A benchmark suite."
+
+    unit: str
+    "The unit of the values of the suite."
+    run: Callable[[bool], dict[str, float]]
+    "Runs the suite. Takes whether to run a quick (less repeated) version."
+
+
+def _import_time(quick: bool) -> dict[str, float]:
+    from textual_pyfiglet.benchmarks import import_time
+
+    return import_time.run(repeats=2 if quick else 7)
+
+
+def _font_load(quick: bool) -> dict[str, float]:
+    from textual_pyfiglet.benchmarks import font_load
+
+    return font_load.run(repeats=1 if quick else 3)
+
+
+def _render(quick: bool) -> dict[str, float]:
+    from textual_pyfiglet.benchmarks import render
+
+    return render.run(repeats=1 if quick else 5)
+
+
+def _trim(quick: bool) -> dict[str, float]:
+    from textual_pyfiglet.benchmarks import trim
+
+    return trim.run(number=2 if quick else 20)
+
+
+def _animation(quick: bool) -> dict[str, float]:
+    from textual_pyfiglet.benchmarks import animation
+
+    return animation.run(repeats=1 if quick else 5)
+
+
+def _memory(quick: bool) -> dict[str, float]:
+    from textual_pyfiglet.benchmarks import memory
+
+    return memory.run()
+
+
+SUITES: dict[str, Suite] = {
+    "import_time": Suite("s", _import_time),
+    "font_load": Suite("s", _font_load),
+    "render": Suite("s", _render),
+    "trim": Suite("s", _trim),
+    "animation": Suite("s, or bytes for frame sizes", _animation),
+    "memory": Suite("bytes", _memory),
+}
+"The benchmark suites, by name, in the order they run."
+
+
+def _version(package: str) -> str | None:
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return None
+
+
+def run_suites(names: Sequence[str] | None = None, quick: bool = False) -> dict[str, Any]:
+    """Run benchmark suites and return the results, ready to be written as JSON.
+
+    Args:
+        names: The names of the suites to run. Defaults to all of them.
+        quick: Whether to repeat the measurements less, for a faster but noisier run.
+    Raises:
+        KeyError: If a name is not in SUITES."""
+
+    results: dict[str, Any] = {}
+    for name in names if names is not None else SUITES:
+        suite = SUITES[name]
+        results[name] = {"unit": suite.unit, "values": suite.run(quick)}
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "textual-pyfiglet": _version("textual-pyfiglet"),
+            "pyfiglet": _version("pyfiglet"),
+            "textual": _version("textual"),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+class Regression(NamedTuple):
+    "A value that got worse than in the baseline."
+
+    suite: str
+    name: str
+    baseline: float
+    value: float
+
+    @property
+    def change(self) -> float:
+        "How much higher the value is than the baseline, as a fraction of the baseline."
+        return self.value / self.baseline - 1
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.1) -> list[Regression]:
+    """Return the values that are more than `threshold` higher than in the baseline.
+    Values that are not in both runs are skipped.
+
+    Args:
+        results: The output of `run_suites`.
+        baseline: The output of an earlier `run_suites`.
+        threshold: The allowed increase, as a fraction of the baseline value."""
+
+    regressions: list[Regression] = []
+    for suite, group in results["results"].items():
+        old_values: dict[str, float] = baseline["results"].get(suite, {}).get("values", {})
+        for name, value in group["values"].items():
+            old = old_values.get(name)
+            if old is not None and old > 0 and value > old * (1 + threshold):
+                regressions.append(Regression(suite, name, old, value))
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the `bench` command. Returns the exit status.
+
+    Args:
+        argv: The arguments after `bench`. Defaults to the command line arguments."""
+
+    parser = argparse.ArgumentParser(prog="textual-pyfiglet bench", description="Run the benchmarks.")
+    parser.add_argument("-o", "--output", help="Write the results to this file instead of stdout.")
+    parser.add_argument("-b", "--baseline", help="Compare the results against this earlier output.")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="The allowed increase over the baseline, as a fraction (default: 0.1).",
+    )
+    parser.add_argument(
+        "--only",
+        type=lambda value: value.split(","),
+        help=f"Comma separated suites to run (default: all). Choose from: {', '.join(SUITES)}.",
+    )
+    parser.add_argument("--quick", action="store_true", help="Repeat the measurements less.")
+    args = parser.parse_args(argv)
+
+    names: list[str] | None = args.only
+    if names is not None:
+        unknown = [name for name in names if name not in SUITES]
+        if unknown:
+            parser.error(f"unknown suite: {', '.join(unknown)}")
+
+    results = run_suites(names, quick=args.quick)
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression.suite}: {regression.name}: "
+                f"{regression.baseline:.6g} -> {regression.value:.6g} (+{regression.change:.0%})",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+        print(f"No regressions over {args.threshold:.0%} against {args.baseline}.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
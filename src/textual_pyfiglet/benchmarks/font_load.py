@@ -0,0 +1,57 @@
+"""Benchmark for the time it takes to load every font in ALL_FONTS with the font registry.
+
+The font pack is opened before timing, so each time is only the time to decode (or
+parse, without the pack) one font."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import time
+from typing import get_args
+
+# Local imports
+from textual_pyfiglet.font_registry import FontRegistry
+from textual_pyfiglet.fonts_list import ALL_FONTS
+
+TOTAL = "all fonts (total)"
+"The key of the sum of the times of every font."
+
+
+def run(repeats: int = 3, use_pack: bool = True) -> dict[str, float]:
+    """Load every font in ALL_FONTS. Returns a dict of font name to the best time of
+    loading it, in seconds, plus the sum of all of them under TOTAL.
+
+    Args:
+        repeats: How many times each font is loaded. The best time is kept.
+        use_pack: Whether to load the fonts from the font pack, or parse them with Pyfiglet."""
+
+    registry = FontRegistry(use_pack=use_pack)
+    registry.get("standard")  # Opens the font pack.
+
+    results: dict[str, float] = {}
+    for font in get_args(ALL_FONTS):
+        best = float("inf")
+        for _ in range(repeats):
+            registry.evict(font)
+            start = time.perf_counter()
+            registry.get(font)
+            best = min(best, time.perf_counter() - start)
+        results[font] = best
+    results[TOTAL] = sum(results.values())
+    return results
+
+
+def main() -> None:
+
+    results = run()
+    slowest = sorted((font for font in results if font != TOTAL), key=results.__getitem__, reverse=True)
+    for font in slowest[:10]:
+        print(f"{font:<35} {results[font] * 1000:8.3f} ms")
+    print(f"{TOTAL:<35} {results[TOTAL] * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
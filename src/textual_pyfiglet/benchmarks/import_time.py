@@ -0,0 +1,69 @@
+"""Benchmark for the time it takes to import the package.
+
+Every measurement runs in a fresh interpreter, so nothing is already in `sys.modules`.
+Only the statement itself is timed, not the start up of the interpreter."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import statistics
+import subprocess
+import sys
+
+STATEMENTS: dict[str, str] = {
+    "import textual_pyfiglet": "import textual_pyfiglet",
+    "figlet_quick (import + render)": (
+        "from textual_pyfiglet import figlet_quick; figlet_quick('Hello', font='standard')"
+    ),
+    "FigletWidget": "from textual_pyfiglet import FigletWidget",
+}
+"The statements to time. Maps a description to the code that is run."
+
+_TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def time_statement(statement: str, repeats: int = 7) -> float:
+    """Return the median time in seconds that it takes to run `statement` in a fresh
+    interpreter.
+
+    Args:
+        statement: The Python code to time.
+        repeats: How many interpreters to start. The median of all runs is returned."""
+
+    timings: list[float] = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(timings)
+
+
+def run(repeats: int = 7) -> dict[str, float]:
+    """Time every statement in STATEMENTS. Returns a dict of description to median seconds.
+
+    Args:
+        repeats: How many interpreters to start for each statement."""
+
+    return {name: time_statement(statement, repeats) for name, statement in STATEMENTS.items()}
+
+
+def main() -> None:
+
+    for name, seconds in run().items():
+        print(f"{name:<35} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
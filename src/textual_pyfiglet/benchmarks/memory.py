@@ -0,0 +1,80 @@
+"""Benchmark for peak memory use, measured with `tracemalloc`. Every measurement starts
+from empty caches, so it counts everything that the step allocates."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import tracemalloc
+from typing import Callable, get_args
+
+# Local imports
+from textual_pyfiglet.benchmarks.animation import COLORS, make_lines
+from textual_pyfiglet.benchmarks.render import make_text
+from textual_pyfiglet.font_registry import FontRegistry
+from textual_pyfiglet.fonts_list import ALL_FONTS
+from textual_pyfiglet.render_cache import RenderCache
+from textual_pyfiglet.renderer import CustomFiglet, render_cached
+from textual_pyfiglet.strips import FrameCycle
+
+
+def peak_memory(function: Callable[[], object]) -> int:
+    """Return the peak memory allocated while `function` runs, in bytes.
+
+    Args:
+        function: The function to measure. It is called once."""
+
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _load_all_fonts() -> FontRegistry:
+    registry = FontRegistry()
+    for font in get_args(ALL_FONTS):
+        registry.get(font)
+    return registry
+
+
+def _render_long_text() -> RenderCache:
+    cache = RenderCache()
+    render_cached(CustomFiglet(font="standard", width=200, justify="center"), make_text(1000), True, cache)
+    return cache
+
+
+def _style_cycle() -> FrameCycle:
+    lines = make_lines()
+    cycle = FrameCycle(lines, COLORS, "gradient", True, max(len(line) for line in lines))
+    for phase in range(len(cycle)):
+        cycle.frame(phase)
+    return cycle
+
+
+STEPS: dict[str, Callable[[], object]] = {
+    "load all fonts": _load_all_fonts,
+    "render 1000 chars": _render_long_text,
+    "style a horizontal gradient cycle": _style_cycle,
+}
+"The steps to measure. Maps a description to a function that runs the step."
+
+
+def run() -> dict[str, float]:
+    """Measure every step in STEPS. Returns a dict of description to peak bytes."""
+
+    _render_long_text()  # Warm up Pyfiglet's own imports and caches.
+    return {name: float(peak_memory(step)) for name, step in STEPS.items()}
+
+
+def main() -> None:
+
+    for name, peak in run().items():
+        print(f"{name:<40} {peak / 1024:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
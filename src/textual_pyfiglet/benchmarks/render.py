@@ -0,0 +1,71 @@
+"""Benchmark for the render latency of the FigletWidget (`render_cached`, which is what
+`FigletWidget.render_figlet` runs) across text lengths and render widths, both when the
+render is not in the render cache and when it is."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import time
+import timeit
+
+# Local imports
+from textual_pyfiglet.render_cache import RenderCache
+from textual_pyfiglet.renderer import CustomFiglet, render_cached
+
+FONTS = ("standard", "big")
+TEXT_LENGTHS = (10, 50, 200)
+"The lengths of the texts to render, in characters."
+WIDTHS = (40, 80, 200)
+"The render widths, in characters."
+
+_WORDS = "The quick brown fox jumps over the lazy dog 0123456789 "
+
+
+def make_text(length: int) -> str:
+    """Return a text of `length` characters, made of words and digits."""
+
+    return (_WORDS * (length // len(_WORDS) + 1))[:length]
+
+
+def run(repeats: int = 5) -> dict[str, float]:
+    """Time the renders of every font, text length and width. Returns a dict of description
+    to the best time of one render, in seconds.
+
+    Args:
+        repeats: How many times each render is timed. The best time is kept."""
+
+    results: dict[str, float] = {}
+    cache = RenderCache()
+    for font in FONTS:
+        figlet = CustomFiglet(font=font, justify="center")
+        for length in TEXT_LENGTHS:
+            text = make_text(length)
+            for width in WIDTHS:
+                figlet.width = width
+                best = float("inf")
+                for _ in range(repeats):
+                    cache.clear()
+                    start = time.perf_counter()
+                    render_cached(figlet, text, True, cache)
+                    best = min(best, time.perf_counter() - start)
+                name = f"{font}, {length} chars, width {width}"
+                results[f"{name} (cold)"] = best
+
+                hit = timeit.repeat(
+                    lambda: render_cached(figlet, text, True, cache), number=100, repeat=repeats
+                )
+                results[f"{name} (cached)"] = min(hit) / 100
+    return results
+
+
+def main() -> None:
+
+    for name, seconds in run().items():
+        print(f"{name:<45} {seconds * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark for `trim_render`, the post-processing step that strips the blank lines
+and trims the sides of a render, on tall (100+ line) renders."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import timeit
+
+# Local imports
+from textual_pyfiglet.renderer import CustomFiglet, trim_render
+
+LINE_COUNTS = (120, 600, 1200)
+"The heights of the renders to trim, in lines."
+
+
+def make_render(line_count: int) -> list[str]:
+    """Return the lines of a centered 'standard' font render that is `line_count` lines tall,
+    with a few blank lines at the top and bottom like Pyfiglet output has.
+
+    Args:
+        line_count: The number of lines of the render."""
+
+    figlet = CustomFiglet(font="standard", width=200, justify="center")
+    text = "\n".join(f"Hello World {i}" for i in range(line_count // figlet.Font.height + 1))
+    lines = str(figlet.renderText(text)).splitlines()[: line_count - 10]
+    blank = " " * 200
+    return [blank] * 5 + lines + [blank] * 5
+
+
+def run(number: int = 20) -> dict[str, float]:
+    """Time trim_render on renders of every height in LINE_COUNTS.
+    Returns a dict of description to the best time of one call, in seconds.
+
+    Args:
+        number: How many calls to time in each of the repeats."""
+
+    results: dict[str, float] = {}
+    for line_count in LINE_COUNTS:
+        lines = make_render(line_count)
+        for trim in (False, True):
+            timings = timeit.repeat(lambda: trim_render(lines, trim), number=number, repeat=5)
+            results[f"trim_render {line_count} lines, trim={trim}"] = min(timings) / number
+    return results
+
+
+def main() -> None:
+
+    for name, seconds in run().items():
+        print(f"{name:<40} {seconds * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+gallery.py
+This module defines the FontGalleryScreen, which shows a preview of every font.
+
+The previews are rendered in the background by a small pool of threads and shown
+as soon as they are ready. When they are all done, they are saved to a file in
+the user's cache directory, so the next time the demo is started the gallery
+opens straight from the file without rendering anything.
+"""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# Python imports
+from __future__ import annotations
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Textual imports
+from textual import events, on
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.screen import Screen
+from textual.widgets import Footer, OptionList, Static
+from textual.widgets.option_list import Option
+from rich.text import Text
+
+# Other library imports
+from pyfiglet.version import __version__ as pyfiglet_version
+
+# Local imports
+from textual_pyfiglet._atomic import atomic_write
+from textual_pyfiglet.disk_cache import default_cache_dir
+from textual_pyfiglet.figletwidget import FigletWidget
+from textual_pyfiglet.renderer import figlet_quick, trim_render
+
+SAMPLE_TEXT = "Abc 123"
+PREVIEW_WIDTH = 200
+GALLERY_WORKERS = 4  # Maximum number of threads rendering previews at the same time.
+BATCH_SIZE = 25  # Number of fonts rendered by each task, and shown at a time.
+
+
+def gallery_cache_path() -> Path:
+    """Return the path of the file that the previews are saved in, inside the
+    textual-pyfiglet cache directory."""
+
+    return default_cache_dir() / "gallery.json"
+
+
+def load_previews(path: Path) -> dict[str, str]:
+    """Load the saved previews. Returns an empty dict if there is no file, or if it was
+    saved with a different sample text or Pyfiglet version."""
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data["sample"] != SAMPLE_TEXT or data["pyfiglet_version"] != pyfiglet_version:
+            return {}
+        previews = data["previews"]
+        assert isinstance(previews, dict)
+        return {str(font): str(preview) for font, preview in previews.items()}  # type: ignore[unused-ignore]
+    except (OSError, ValueError, KeyError, TypeError, AssertionError):
+        return {}
+
+
+def save_previews(path: Path, previews: dict[str, str]) -> None:
+    """Save the previews. The file is written to a temporary file first and then moved
+    into place, so another demo that is reading it never sees a half written file."""
+
+    data = {"sample": SAMPLE_TEXT, "pyfiglet_version": pyfiglet_version, "previews": previews}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, json.dumps(data).encode("utf-8"))
+
+
+def render_previews(fonts: list[str]) -> list[tuple[str, str]]:
+    """Render the sample text in each of the fonts. Fonts that fail to render
+    get an empty preview."""
+
+    results: list[tuple[str, str]] = []
+    for font in fonts:
+        try:
+            render = figlet_quick(SAMPLE_TEXT, font=font, width=PREVIEW_WIDTH)  # type: ignore[arg-type]
+        except Exception:
+            render = ""
+        results.append((font, "\n".join(trim_render(render.splitlines(), True))))
+    return results
+
+
+class FontGalleryScreen(Screen[str]):
+    """Shows a preview of every font. Dismisses with the name of the font that was selected.
+
+    Install this screen (`App.install_screen`) instead of pushing a new one every time,
+    so that a second visit does not need to build the previews again."""
+
+    BINDINGS = [
+        Binding("escape", "close_screen", description="Close the gallery.", show=True),
+    ]
+
+    previews: dict[str, str] = {}
+    "The previews that have been rendered, by font. Shared by all gallery screens."
+
+    def __init__(self, cache_path: Path | None = None) -> None:
+        super().__init__()
+        self.cache_path = gallery_cache_path() if cache_path is None else cache_path
+        self.fonts = sorted(FigletWidget.fonts_list)
+        self.shown = 0
+
+    def compose(self) -> ComposeResult:
+
+        yield Static(id="gallery_status")
+        yield OptionList(id="gallery_list")
+        yield Footer()
+
+    def on_mount(self) -> None:
+
+        if not self.previews:
+            self.previews.update(load_previews(self.cache_path))
+        self.show_ready_previews()
+        if self.shown < len(self.fonts):
+            self.run_worker(self.render_missing, name="font_gallery", group="font_gallery", thread=True)
+
+    def show_ready_previews(self) -> None:
+        """Mount the previews that are ready, in alphabetical order."""
+
+        new: list[Option] = []
+        while self.shown < len(self.fonts) and self.fonts[self.shown] in self.previews:
+            font = self.fonts[self.shown]
+            prompt = Text.assemble((font, "bold"), "\n", self.previews[font], "\n")
+            new.append(Option(prompt, id=font))
+            self.shown += 1
+        if new:
+            self.query_one("#gallery_list", OptionList).add_options(new)
+
+        status = self.query_one("#gallery_status", Static)
+        if self.shown < len(self.fonts):
+            status.update(f"Rendering previews... {self.shown} / {len(self.fonts)}")
+        else:
+            status.update(f"{len(self.fonts)} fonts. Select a font to use it.")
+
+    def render_missing(self) -> None:
+        """Runs in a thread worker. Renders the previews that are not saved yet with a
+        bounded pool of threads, and shows them batch by batch."""
+
+        missing = [font for font in self.fonts if font not in self.previews]
+        batches = [missing[i : i + BATCH_SIZE] for i in range(0, len(missing), BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=GALLERY_WORKERS) as executor:
+            for results in executor.map(render_previews, batches):  # Yields in submission order.
+                self.app.call_from_thread(self.add_previews, results)
+
+        try:
+            save_previews(self.cache_path, dict(self.previews))
+        except OSError as e:
+            self.log.error(f"Could not save the font previews to {self.cache_path}: {e}")
+
+    def add_previews(self, results: list[tuple[str, str]]) -> None:
+
+        self.previews.update(results)
+        self.show_ready_previews()
+
+    @on(events.ScreenResume)
+    def focus_gallery(self) -> None:
+        self.query_one("#gallery_list", OptionList).focus()
+
+    @on(OptionList.OptionSelected, "#gallery_list")
+    def font_selected(self, event: OptionList.OptionSelected) -> None:
+        self.dismiss(event.option.id)
+
+    def action_close_screen(self) -> None:
+        self.dismiss()
@@ -10,6 +10,7 @@ It has its own entry script. Run with `textual-pyfiglet`.
 
 # Python imports
 from __future__ import annotations
+import sys
 from typing import Any  # , cast
 
 # from pathlib import Path
@@ -31,6 +32,7 @@ from textual_pyfiglet.figletwidget import FigletWidget
 from textual_pyfiglet.demo.datawidget import ActiveColors
 from textual_pyfiglet.demo.settingsbar import SettingsWidget
 from textual_pyfiglet.demo.screens import HelpScreen
+from textual_pyfiglet.demo.gallery import FontGalleryScreen
 
 
 class BottomBar(Horizontal):
@@ -67,6 +69,7 @@ class TextualPyFigletDemo(App[Any]):
     BINDINGS = [
         Binding("ctrl+b", "toggle_menu", "Expand/collapse the menu"),
         Binding("f1", "show_help", "Show help"),
+        Binding("f2", "show_gallery", "Font gallery"),
     ]
 
     CSS_PATH = "styles.tcss"
@@ -149,9 +152,26 @@ class TextualPyFigletDemo(App[Any]):
         "Show the help screen in the demo app."
         self.push_screen(HelpScreen())
 
+    def action_show_gallery(self) -> None:
+        "Show the font gallery in the demo app."
+        # The gallery is installed rather than pushed as a new screen each time. This keeps
+        # its previews (and its background worker), so a second visit opens instantly.
+        if not self.is_screen_installed("font_gallery"):  # type: ignore[unused-ignore]
+            self.install_screen(FontGalleryScreen(), name="font_gallery")  # type: ignore[unused-ignore]
+        self.push_screen("font_gallery", callback=self.gallery_closed)
+
+    def gallery_closed(self, font: str | None) -> None:
+
+        if font:
+            self.query_one(SettingsWidget).font_select.value = font  # triggers font_changed
+
 
 def run_demo() -> None:
-    """Run the demo app."""
+    """Run the demo app, or the benchmarks with `textual-pyfiglet bench`."""
+    if sys.argv[1:2] == ["bench"]:
+        from textual_pyfiglet.benchmarks.cli import main
+
+        sys.exit(main(sys.argv[2:]))
     app = TextualPyFigletDemo()
     app.run()
 
@@ -0,0 +1,195 @@
+"""Module for the DiskRenderCache class.
+
+The disk cache keeps renders across restarts of the application. It is optional, and
+is turned on by setting `FigletWidget.disk_cache`:
+
+```
+from textual_pyfiglet import FigletWidget
+from textual_pyfiglet.disk_cache import DiskRenderCache
+
+FigletWidget.disk_cache = DiskRenderCache()
+```
+
+Every render is stored in its own file, named after a hash of the render settings and
+the Pyfiglet version. Files are written to a temporary file and then renamed into
+place, so a reader never sees a half written file, and any number of processes can
+share the same cache directory."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+# Other library imports
+from pyfiglet.version import __version__ as pyfiglet_version
+
+# Local imports
+from textual_pyfiglet._atomic import atomic_write
+from textual_pyfiglet.render_cache import RenderKey
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory of textual-pyfiglet. This follows the XDG spec
+    ($XDG_CACHE_HOME, or ~/.cache), and uses %LOCALAPPDATA% on Windows."""
+
+    if os.environ.get("XDG_CACHE_HOME"):
+        base = Path(os.environ["XDG_CACHE_HOME"])
+    elif os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+        base = Path(os.environ["LOCALAPPDATA"])
+    else:
+        base = Path.home() / ".cache"
+    return base / "textual-pyfiglet"
+
+
+class DiskRenderCache:
+    """A persistent, size-bounded LRU cache of raw Pyfiglet renders.
+
+    Reading an entry updates its modification time, and when the cache grows over
+    `max_bytes`, the entries that were least recently used are deleted until it is
+    back under 90% of the limit. This is safe to use from several threads and
+    several processes at the same time."""
+
+    def __init__(
+        self, directory: str | os.PathLike[str] | None = None, max_bytes: int = 64 * 1024**2
+    ) -> None:
+        """Create a DiskRenderCache. The directory is created when the first render is stored.
+
+        Args:
+            directory: The directory to store the renders in. Defaults to 'renders' in the
+                textual-pyfiglet cache directory (see `default_cache_dir`).
+            max_bytes: Maximum total size of the stored renders, in bytes.
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be a positive integer.")
+
+        self.directory = default_cache_dir() / "renders" if directory is None else Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._bytes: int | None = None  # Counted lazily, on the first put.
+
+    def get(self, key: RenderKey) -> str | None:
+        """Look up a raw render. Returns None if it is not stored (or cannot be read).
+
+        Args:
+            key: The render key. The trim setting (the last item) is ignored, because
+                the raw render does not depend on it."""
+
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                header = f.readline()
+                raw = f.read()
+        except (OSError, ValueError):
+            return None
+
+        if header != self._header(key):  # Hash collision, or a corrupt file.
+            return None
+        try:
+            os.utime(path)  # Mark as recently used.
+        except OSError:
+            pass  # Another process may have evicted it in the meantime.
+        return raw
+
+    def put(self, key: RenderKey, raw: str) -> None:
+        """Store a raw render, evicting the least recently used renders if the cache is
+        over its size limit. Errors writing to the disk are ignored (the cache is only
+        an optimization).
+
+        Args:
+            key: The render key. The trim setting (the last item) is ignored.
+            raw: The raw string returned by Pyfiglet."""
+
+        data = (self._header(key) + raw).encode("utf-8")
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, data)
+        except OSError:
+            return
+
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = self._scan_size()
+            else:
+                self._bytes += len(data)
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def clear(self) -> None:
+        """Delete every stored render."""
+
+        with self._lock:
+            for path, _, _ in self._entries():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._bytes = 0
+
+    def size(self) -> int:
+        """Return the total size of the stored renders, in bytes."""
+
+        with self._lock:
+            self._bytes = self._scan_size()
+            return self._bytes
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._entries())
+
+    def _path(self, key: RenderKey) -> Path:
+
+        digest = hashlib.sha256(self._header(key).encode("utf-8")).hexdigest()
+        return self.directory / digest[:2] / digest
+
+    @staticmethod
+    def _header(key: RenderKey) -> str:
+
+        text, font, width, justify, direction, _ = key
+        return json.dumps([text, font, width, justify, direction, pyfiglet_version]) + "\n"
+
+    def _entries(self) -> list[tuple[Path, int, float]]:
+        """Return (path, size, modification time) of every stored render."""
+
+        entries: list[tuple[Path, int, float]] = []
+        try:
+            subdirs = list(os.scandir(self.directory))
+        except OSError:
+            return entries
+        for subdir in subdirs:
+            if not subdir.is_dir():
+                continue
+            try:
+                for entry in os.scandir(subdir.path):
+                    if entry.name.startswith("."):  # Temporary file of a write in progress.
+                        continue
+                    stat = entry.stat()
+                    entries.append((Path(entry.path), stat.st_size, stat.st_mtime))
+            except OSError:
+                continue  # Removed by another process.
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    # Must be called while holding the lock.
+    def _evict(self) -> None:
+
+        entries = self._entries()  # Re-scan, other processes might have added or removed renders.
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 9 // 10
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                pass  # Already evicted by another process.
+            total -= size
+        self._bytes = total
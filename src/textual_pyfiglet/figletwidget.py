@@ -6,62 +6,48 @@
 
 # STANDARD LIBRARY IMPORTS
 from __future__ import annotations
-from typing import cast
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import Generator, cast
 from typing_extensions import Literal, get_args
 
 # Other library imports
-from pyfiglet import Figlet, FigletError, figlet_format
+from pyfiglet import FigletError
 
 # Textual and Rich imports
 from textual.css.scalar import Scalar
+from textual.dom import NoScreen
+from textual.geometry import Region
+from textual.screen import Screen
 from textual.widget import Widget
 from textual.reactive import reactive
+from textual.strip import Strip
+from textual.timer import Timer
 
 # Textual third-party library imports
 from textual_coloromatic import Coloromatic
 
 # Local imports:
 from textual_pyfiglet.fonts_list import ALL_FONTS
+from textual_pyfiglet.font_registry import FontRegistry, font_registry
+from textual_pyfiglet.render_cache import RenderCache, RenderKey, RenderResult, render_cache
+from textual_pyfiglet.disk_cache import DiskRenderCache
+from textual_pyfiglet.animation_clock import AnimationClock
+from textual_pyfiglet import renderer
+from textual_pyfiglet.measure import Measurement, measure, measure_figlet, natural_width
+from textual_pyfiglet.renderer import CustomFiglet, JUSTIFY_OPTIONS
+from textual_pyfiglet.strips import FrameCycle, frame_bytes, text_style_shows_spaces
 
 # CONSTANTS:
-JUSTIFY_OPTIONS = Literal["left", "center", "right"]
 COLOR_MODE = Literal["color", "gradient", "none"]
 ANIMATION_TYPE = Literal["gradient", "smooth_strobe", "fast_strobe"]
-
-
-class CustomFiglet(Figlet):
-
-    @property
-    def direction(self) -> str:
-        if self._direction == "auto":
-            direction = self.Font.printDirection
-            if direction == 0:
-                return "left-to-right"
-            elif direction == 1:
-                return "right-to-left"
-            else:
-                return "left-to-right"
-        else:
-            return self._direction
-
-    @direction.setter
-    def direction(self, value: str) -> None:
-        self._direction = value
-
-    @property
-    def justify(self) -> str:
-        if self._justify == "auto":
-            if self.direction == "left-to-right":
-                return "left"
-            else:
-                assert self.direction == "right-to-left"
-                return "right"
-        else:
-            return self._justify
-
-    @justify.setter
-    def justify(self, value: str) -> None:
-        self._justify = value
+UPDATE_POLICY = Literal["immediate", "coalesce"]
+FIT_OPTIONS = Literal["none", "auto"]
+FIT_FALLBACK_FONTS: list[ALL_FONTS] = ["small", "mini", "term"]
+"The fonts that fit='auto' tries after the widget's font, when no fit_fonts are given."
 
 
 class FigletWidget(Coloromatic):
@@ -74,6 +60,20 @@ class FigletWidget(Coloromatic):
     fonts_list: list[str] = list(get_args(ALL_FONTS))
     """A list of all the available fonts in the Pyfiglet package."""
 
+    render_cache: RenderCache = render_cache
+    """The process-wide render cache that is shared by all FigletWidgets. Use this to
+    inspect the hit/miss counters with `info()`, change its limits with `resize()`,
+    or empty it with `clear()`."""
+
+    font_registry: FontRegistry = font_registry
+    """The process-wide font registry that is shared by all FigletWidgets. Every font is
+    only parsed once. Use `resident_fonts()` to see which fonts are currently loaded."""
+
+    disk_cache: DiskRenderCache | None = None
+    """An optional persistent render cache, shared by all FigletWidgets. It is off by default.
+    Set it to a `DiskRenderCache` to keep renders across restarts of the app, so that
+    the renders of a previous run are shown without running Pyfiglet again."""
+
     ############################
     # ~ Public API Reactives ~ #
     ############################
@@ -93,6 +93,11 @@ class FigletWidget(Coloromatic):
     the set_justify() method to set the justification using a string. This is useful for
     passing in a variable."""
 
+    fit: reactive[FIT_OPTIONS] = reactive[FIT_OPTIONS]("none")
+    """Whether to choose the font automatically. With 'auto', the widget renders with the
+    widest of its `fit_fonts` that fits in the render width without wrapping. The font it
+    chose is in `fitted_font`. With 'none' (the default), the `font` is always used."""
+
     def __init__(
         self,
         text: str = "",
@@ -106,6 +111,12 @@ class FigletWidget(Coloromatic):
         horizontal: bool = False,
         reverse: bool = False,
         fps: float | str = "auto",
+        update_policy: UPDATE_POLICY = "immediate",
+        max_latency: float = 1 / 60,
+        render_in_thread: bool = False,
+        fit: FIT_OPTIONS = "none",
+        fit_fonts: list[ALL_FONTS] | None = None,
+        pause_when_hidden: bool = True,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -149,6 +160,31 @@ class FigletWidget(Coloromatic):
                 This is a float so that you can set it to values such as 0.5 if you desire. The default
                 is 'auto', which will set the FPS to 12 for 'gradient', 12 for 'smooth_strobe', and 1
                 for 'fast_strobe'.
+            update_policy: Can be 'immediate' or 'coalesce'. The default is 'immediate'.
+                - 'immediate' renders every time the text (or font, justify, or size) changes.
+                - 'coalesce' collapses a burst of changes into a single render, which happens at
+                most `max_latency` seconds after the first change of the burst. The final value is
+                always rendered. Use this when the text is updated many times per second.
+                Before the widget is mounted, changes are always rendered immediately.
+            max_latency: The maximum time in seconds that a change waits before it is rendered,
+                when update_policy is 'coalesce'. The default is 1/60 (one screen refresh).
+            render_in_thread: Whether to render in a worker thread instead of on the event loop.
+                The previous render stays on screen until the new one is ready. If the text changes
+                again while a render is in progress, that render is discarded. This is useful for big
+                fonts with long text, which can take tens of milliseconds to render.
+            fit: Can be 'none' or 'auto'. The default is 'none'.
+                - 'none' always renders with the font.
+                - 'auto' renders with the widest of the fit_fonts whose render fits in the
+                width without wrapping. If none of them fit, the narrowest one is used. The
+                widths are predicted from the glyph widths and smushing rules of each font,
+                without rendering, and are only computed again when the text changes.
+            fit_fonts: The fonts that fit='auto' chooses from. Ties are won by the font that
+                comes first. The default is the font, followed by 'small', 'mini' and 'term'.
+            pause_when_hidden: Whether to pause the animation while the widget cannot be seen:
+                when it is scrolled out of view, when `display` is False, or when it is on a screen
+                that is not shown or is covered by a screen on top of it. When it can be seen again,
+                the animation resumes at the frame it would have reached if it had kept running.
+                The default is True.
             name: Name of widget.
             id: ID of Widget.
             classes: Space separated list of class names.
@@ -159,6 +195,37 @@ class FigletWidget(Coloromatic):
         except Exception as e:
             raise e
 
+        if update_policy not in get_args(UPDATE_POLICY):
+            raise ValueError(f"Invalid update policy: {update_policy} \nMust be 'immediate' or 'coalesce'.")
+        if max_latency < 0:
+            raise ValueError("max_latency must be 0 or a positive number of seconds.")
+        for fit_font in fit_fonts or []:
+            self.validate_font(fit_font)
+
+        self.update_policy = update_policy
+        self.max_latency = max_latency
+        self.render_in_thread = render_in_thread
+        self._coalesce_timer: Timer | None = None
+        self._render_generation = 0
+        self._render_lock = threading.Lock()
+        self._last_render_key: RenderKey | None = None
+        self._batch_depth = 0
+        self._batch_pending = False
+        self.figlet = CustomFiglet()
+        self._incremental = renderer.IncrementalRenderer()
+        self.fit_fonts: list[ALL_FONTS] | None = fit_fonts
+        self.fitted_font: str = font
+        "The font that the last render used. This is the font, unless fit is 'auto'."
+        self._fit_text = ""
+        self._fit_widths: dict[str, int] = {}
+        self._frames: FrameCycle | None = None
+        self._frames_key: tuple[int, int, bool] | None = None
+        self._frame_phase = 0  # How many times the colors were rotated, instead of rotating them.
+        self.pause_when_hidden = pause_when_hidden
+        self._paused_at: tuple[float, float] | None = None  # (time, interval) of a hidden animation.
+        self._style_version = 0  # Bumped whenever the lines or their colors change.
+        self._keep_spaces = False  # Whether the CSS text-style shows on spaces, set on each paint.
+
         super().__init__(
             name=name,
             id=id,
@@ -172,12 +239,13 @@ class FigletWidget(Coloromatic):
             fps=fps,
         )
 
-        self.figlet = CustomFiglet()
         self._previous_height: int = 0
 
-        self.font = font
-        self.justify = justify
-        self.text_input = string
+        with self.batch_update():
+            self.font = font
+            self.justify = justify
+            self.fit = fit
+            self.text_input = string
 
     #################
     # ~ Public API ~#
@@ -223,6 +291,77 @@ class FigletWidget(Coloromatic):
 
         self.font = cast(ALL_FONTS, font)
 
+    @contextmanager
+    def batch_update(self) -> Generator[None, None, None]:
+        """Context manager to change several settings at once with a single render.
+        Inside the `with` block, changing the text, font, or justify does not render.
+        When the block exits, the figlet is rendered once (if anything changed) and one
+        `Updated` message is posted. Batches can be nested, the render happens when the
+        outermost one exits. If the outermost block raises, the text, font, justify and
+        width go back to what they were before it, so they match what is shown, and nothing
+        is rendered.
+
+        Example:
+        ```
+        with figlet_widget.batch_update():
+            figlet_widget.font = "slant"
+            figlet_widget.justify = "left"
+            figlet_widget.update("New text")
+        ```"""
+
+        before = None
+        if self._batch_depth == 0:
+            before = (self.text_input, self.font, self.justify, self.figlet.width, self.fitted_font)
+        self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            if before is not None:
+                # Roll back instead of rendering a half-applied batch. The watchers only mark
+                # the batch as pending here, since it has not ended yet.
+                self.text_input, self.font, self.justify, self.figlet.width, fitted_font = before
+                if self.figlet.font != fitted_font:
+                    self.figlet.setFont(font=fitted_font)
+                self.fitted_font = fitted_font
+                self._batch_pending = False
+            raise
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0 and self._batch_pending:
+            self._batch_pending = False
+            self.watch_text_input(self.text_input)
+
+    def configure(
+        self,
+        *,
+        text: str | None = None,
+        font: ALL_FONTS | None = None,
+        justify: JUSTIFY_OPTIONS | None = None,
+        width: int | None = None,
+    ) -> None:
+        """Change several settings at once, with a single render and a single `Updated`
+        message. Settings that are not passed (or are None) are left as they are.
+        This is the same as setting them inside of `batch_update()`.
+
+        Args:
+            text: The text to render.
+            font: The font to use. Must be one of the available fonts.
+            justify: The justification. Can be 'left', 'center', or 'right'.
+            width: The width to render to, in characters. Note that this is set again
+                from the size of the widget (or its parent, if the width is auto) whenever
+                the widget is resized."""
+
+        with self.batch_update():
+            if font is not None:
+                self.font = font
+            if justify is not None:
+                self.justify = justify
+            if width is not None:
+                self.figlet.width = width
+                self.text_input = self.text_input  # The width is not a reactive.
+            if text is not None:
+                self.text_input = text
+
     def get_figlet_as_string(self) -> str:
         """Return the PyFiglet render as a string."""
 
@@ -232,10 +371,76 @@ class FigletWidget(Coloromatic):
     def figlet_quick(
         cls, text: str, font: ALL_FONTS = "standard", width: int = 80, justify: JUSTIFY_OPTIONS = "left"
     ) -> str:
-        """This is a standalone class method. It just provides quick access to the figlet_format
-        function in the pyfiglet package.
-        It also adds type hinting / auto-completion for the fonts list."""
-        return str(figlet_format(text=text, font=font, width=width, justify=justify))
+        """This is a standalone class method. It provides quick access to rendering a figlet,
+        the same as the figlet_format function in the pyfiglet package, except it uses the
+        shared font registry so the font is not loaded again on every call.
+        It also adds type hinting / auto-completion for the fonts list.
+
+        This does not need a widget. If you don't need the widget at all, you can also use
+        `textual_pyfiglet.figlet_quick`, which does not import Textual."""
+        return renderer.figlet_quick(text, font=font, width=width, justify=justify)
+
+    @classmethod
+    async def render_async(
+        cls,
+        text: str,
+        font: ALL_FONTS = "standard",
+        width: int = 80,
+        justify: JUSTIFY_OPTIONS = "left",
+        trim: bool = True,
+    ) -> list[str]:
+        """This is a standalone class method. It renders a figlet in the event loop's default
+        executor, so it does not block the event loop, and returns the list of lines the same
+        way a FigletWidget would display them. It uses the shared font registry and render cache.
+        Identical requests made while a render is still running share that render.
+
+        Args:
+            text: The text to render.
+            font: The font to use. Default is 'standard'.
+            width: The maximum width of the render, in characters.
+            justify: Justification for the text. Default is 'left'.
+            trim: Whether to also cut off the empty space on the left and right sides
+                (The widget does this when its width is 'auto')."""
+
+        return await renderer.render_lines_async(text, font=font, width=width, justify=justify, trim=trim)
+
+    @classmethod
+    def measure(
+        cls,
+        text: str,
+        font: ALL_FONTS = "standard",
+        width: int | None = None,
+        justify: JUSTIFY_OPTIONS = "left",
+        trim: bool = True,
+    ) -> Measurement:
+        """This is a standalone class method. It returns the width and height of a figlet
+        without rendering it: the size is computed from the glyph widths and the smushing
+        rules of the font, in O(len(text)) time, and always agrees with the real render.
+
+        Args:
+            text: The text to measure.
+            font: The font to use. Default is 'standard'.
+            width: The maximum width of the render, in characters. If None (the default),
+                the text is measured on a single line, without wrapping.
+            justify: Justification for the text. Default is 'left'.
+            trim: Whether to also cut off the empty space on the left and right sides
+                (The widget does this when its width is 'auto').
+        Raises:
+            CharNotPrinted: If the width is too small for a character."""
+
+        return measure(text, font=font, width=width, justify=justify, trim=trim)
+
+    def measure_text(self, text: str | None = None) -> Measurement:
+        """Return the size this widget's figlet would be with the given text, with the
+        widget's current font, justify and width, without rendering it.
+
+        Args:
+            text: The text to measure. Defaults to the current text of the widget.
+        Raises:
+            CharNotPrinted: If the widget is too narrow for a character."""
+
+        trim = bool(self.styles.width and self.styles.width.is_auto)
+        return measure_figlet(self.figlet, self.text_input if text is None else text, trim)
 
     #################
     # ~ Validators ~#
@@ -257,6 +462,13 @@ class FigletWidget(Coloromatic):
         else:
             raise ValueError(f"Invalid font: {font} \nMust be one of the available fonts.")
 
+    def validate_fit(self, fit: str) -> str:
+
+        if fit in get_args(FIT_OPTIONS):
+            return fit
+        else:
+            raise ValueError(f"Invalid fit: {fit} \nMust be 'none' or 'auto'.")
+
     def validate_justify(self, value: str) -> str:
 
         if value in ("left", "center", "right", "auto"):
@@ -273,6 +485,47 @@ class FigletWidget(Coloromatic):
     #! OVERRIDE
     def watch_text_input(self, text: str) -> None:
 
+        if self._batch_depth > 0:
+            self._batch_pending = True  # Rendered once when the batch ends.
+            return
+
+        if self.update_policy == "coalesce" and self.is_mounted:
+            # Only the latest value matters. It is read when the timer fires.
+            if self._coalesce_timer is None:
+                self._coalesce_timer = self.set_timer(self.max_latency, self._render_coalesced)
+            return
+
+        self._render_text(text)
+
+    def _render_coalesced(self) -> None:
+
+        self._coalesce_timer = None
+        self._render_text(self.text_input)
+
+    def _render_text(self, text: str) -> None:
+
+        if self.fit == "auto":
+            self._fit_font(text)
+        trim = bool(self.styles.width and self.styles.width.is_auto)
+        key = renderer.render_key(self.figlet, text, trim)
+        self._render_generation += 1  # Any render still in progress in a thread is now stale.
+
+        if key == self._last_render_key:
+            # Nothing that affects the render has changed (for instance a resize that did not
+            # change the width), so skip rendering. Callers still expect the Updated message.
+            self.post_message(self.Updated(self))
+            return
+
+        if self.render_in_thread and self.is_mounted and text != "":
+            self.run_worker(
+                partial(self._render_in_thread, self.figlet.copy(), key, self._render_generation),
+                name="render_figlet",
+                group="render_figlet",
+                exclusive=True,  # cancels the previous render worker.
+                thread=True,
+            )
+            return
+
         if text == "":
             self._animation_lines = [""]
             self.mutate_reactive(FigletWidget._animation_lines)
@@ -280,8 +533,39 @@ class FigletWidget(Coloromatic):
             self._animation_lines = self.render_figlet(text)  # ~ <- where the rendering happens
             self.mutate_reactive(FigletWidget._animation_lines)
 
+        self._last_render_key = key
         self.post_message(self.Updated(self))
 
+    def _render_in_thread(self, figlet: CustomFiglet, key: RenderKey, generation: int) -> None:
+
+        text, trim = key[0], key[5]
+        with self._render_lock:  # The incremental renderer can only be used by one thread at a time.
+            if generation != self._render_generation:
+                return  # A newer render was started while this one was waiting.
+            result = renderer.render_cached(
+                figlet, text, trim, self.render_cache, self._incremental, self.disk_cache
+            )
+
+        if generation == self._render_generation:
+            self.app.call_from_thread(self._swap_render, result, key, generation)
+
+    def _swap_render(self, result: RenderResult, key: RenderKey, generation: int) -> None:
+
+        if generation != self._render_generation:
+            return  # A newer render was started after this one.
+
+        self._last_render_key = key
+        self.figlet_render = result.raw
+        self._animation_lines = list(result.lines)
+        self.mutate_reactive(FigletWidget._animation_lines)
+        self.post_message(self.Updated(self))
+
+    #! OVERRIDE
+    def watch_list_input(self, list_in: list[str] | None) -> None:
+
+        self._last_render_key = None  # The lines no longer come from the last render.
+        super().watch_list_input(list_in)
+
     def watch_font(self, font: str) -> None:
 
         try:
@@ -289,7 +573,16 @@ class FigletWidget(Coloromatic):
         except Exception as e:
             self.log.error(f"Error setting font: {e}")
             raise e
+        self.fitted_font = font  # Chosen again when it renders, if fit is 'auto'.
+
+        if self._initialized:
+            self.watch_text_input(self.text_input)  # trigger reactive
+
+    def watch_fit(self, fit: str) -> None:
 
+        if fit == "none" and self.figlet.font != self.font:
+            self.figlet.setFont(font=self.font)
+            self.fitted_font = self.font
         if self._initialized:
             self.watch_text_input(self.text_input)  # trigger reactive
 
@@ -304,10 +597,58 @@ class FigletWidget(Coloromatic):
         if self._initialized:
             self.watch_text_input(self.text_input)  # trigger reactive
 
+    def watch__animation_lines(self) -> None:
+        self._style_version += 1
+
+    #! OVERRIDE
+    def watch__color_mode(self, color_mode: COLOR_MODE) -> None:
+        super().watch__color_mode(color_mode)
+        self._style_version += 1
+        self._frame_phase = 0  # The colors were made again, so they start from the first one.
+
+    #! OVERRIDE
+    def watch_animated(self, animated: bool) -> None:
+        self._paused_at = None  # The timer is stopped or started again.
+        super().watch_animated(animated)
+
+    #! OVERRIDE
+    def watch_animation_fps(self, fps: float | str) -> None:
+        self._paused_at = None
+        super().watch_animation_fps(fps)
+
     ######################
     # ~ RENDERING LOGIC ~#
     ######################
 
+    def on_mount(self) -> None:
+        self.screen.screen_layout_refresh_signal.subscribe(self, self._screen_layout_refreshed)  # type: ignore[unused-ignore]
+        self._sync_clock()
+
+    def on_unmount(self) -> None:
+        AnimationClock.for_app(self.app).unsubscribe(self)
+
+    #! OVERRIDE
+    @property
+    def auto_refresh(self) -> float | None:
+        """Number of seconds between animation frames, or None when it is not animated.
+        FigletWidgets do not have their own refresh timer: the Coloromatic sets this, and
+        the widget subscribes to the app's shared AnimationClock with that frame rate."""
+        return self._auto_refresh
+
+    @auto_refresh.setter
+    def auto_refresh(self, interval: float | None) -> None:
+        self._auto_refresh = interval
+        if self.is_mounted:
+            self._sync_clock()
+
+    def _sync_clock(self) -> None:
+
+        clock = AnimationClock.for_app(self.app)
+        if self._auto_refresh is None:
+            clock.unsubscribe(self)
+        else:
+            clock.subscribe(self, 1 / self._auto_refresh)
+
     def on_resize(self) -> None:
         self.refresh_size()
 
@@ -340,10 +681,42 @@ class FigletWidget(Coloromatic):
         if self.animation_type == "gradient" and self.horizontal:
             self._color_mode = self._color_mode
 
+    def _fit_font(self, text: str) -> None:
+        """Set the figlet to the widest fit font that fits in its width. The natural width of
+        the text in each font is kept until the text changes, so a resize only compares numbers."""
+
+        if text != self._fit_text:
+            self._fit_text = text
+            self._fit_widths = {}
+
+        candidates: list[str] = list(self.fit_fonts or [self.font, *FIT_FALLBACK_FONTS])
+        widths = self._fit_widths
+        for font in candidates:
+            if font not in widths:
+                table = self.font_registry.get(font)
+                try:
+                    widths[font] = natural_width(text, table, self.figlet.direction_for(table))
+                except Exception:
+                    widths[font] = sys.maxsize  # Pyfiglet cannot render it, so it never fits.
+
+        fitting = [font for font in candidates if widths[font] < self.figlet.width]
+        if fitting:
+            chosen = max(fitting, key=widths.__getitem__)
+        else:
+            chosen = min(candidates, key=widths.__getitem__)
+
+        if chosen != self.figlet.font:
+            self.figlet.setFont(font=chosen)
+        self.fitted_font = chosen
+
     def render_figlet(self, text_input: str) -> list[str]:
 
+        trim = bool(self.styles.width and self.styles.width.is_auto)  # if the width is auto, trim the lines
         try:
-            self.figlet_render = str(self.figlet.renderText(text_input))  # * <- Actual render happens here.
+            with self._render_lock:
+                result = renderer.render_cached(
+                    self.figlet, text_input, trim, self.render_cache, self._incremental, self.disk_cache
+                )
         except FigletError as e:
             self.log.error(f"Pyfiglet returned an error when attempting to render: {e}")
             raise e
@@ -351,39 +724,138 @@ class FigletWidget(Coloromatic):
             self.log.error(f"Unexpected error occured when rendering figlet: {e}")
             raise e
         else:
-            render_lines: list[str] = self.figlet_render.splitlines()  # convert into list of lines
-
-            while True:
-                lines_cleaned: list[str] = []
-                for i, line in enumerate(render_lines):
-                    if i == 0 and all(c == " " for c in line):  # if first line and blank
-                        pass
-                    elif i == len(render_lines) - 1 and all(c == " " for c in line):  # if last line and blank
-                        pass
-                    else:
-                        lines_cleaned.append(line)
-
-                if lines_cleaned == render_lines:  # if there's no changes,
-                    break  # loop is done
-                else:  # If lines_cleaned is different, that means there was
-                    render_lines = (
-                        lines_cleaned  # a change. So set render_lines to lines_cleaned and restart loop.
-                    )
-
-            if lines_cleaned == []:  # if the figlet output is blank, return empty list
-                return [""]
-
-            if (
-                self.styles.width and self.styles.width.is_auto
-            ):  # if the width is auto, we need to trim the lines
-                startpoints: list[int] = []
-                for line in lines_cleaned:
-                    for c in line:
-                        if c != " ":  # find first character that is not space
-                            startpoints.append(line.index(c))  # get the index
-                            break
-                figstart = min(startpoints)  # lowest number in this list is the start of the figlet
-                shortened_fig = [line[figstart:].rstrip() for line in lines_cleaned]  # cuts before and after
-                return shortened_fig
+            self.figlet_render = result.raw
+            return list(result.lines)
+
+    #! OVERRIDE
+    def automatic_refresh(self) -> None:
+        """Advance the animation by one frame. Instead of rotating the colors, this moves to
+        the next frame of the cycle, and only the lines that change are repainted. If the
+        widget cannot be seen, the animation is paused."""
+
+        if self.pause_when_hidden and self.animated and not self.can_be_seen():
+            self._pause_animation()
+            return
+        before = self._frame_phase
+        self._advance_frames(1)
+        if not self.is_on_screen:
+            return
+
+        width = self.size.width
+        if self.repeat or self._frames is None or self._frames_key != self._current_frames_key():
+            self.refresh()
+            return
+        # Only repaint the lines that look different in the next frame.
+        spans = self._frames.changed_spans(before, self._frame_phase)
+        if spans:
+            self.refresh(*[Region(0, y, width, height) for y, height in spans])
+
+    def _advance_frames(self, count: int) -> None:
+
+        if self._gradient and self.animated:
+            if self.repeat:  # Patterns are drawn by the Coloromatic.
+                self._line_colors.rotate(self._direction_int * count)
             else:
-                return lines_cleaned
+                self._frame_phase += self._direction_int * count
+
+    def can_be_seen(self) -> bool:
+        """Return True if some part of the widget is on the screen that is shown: it is on the
+        current screen (or on a screen behind a modal screen), it is displayed and not scrolled
+        out of view, and it is not completely covered by an opaque widget of a screen on top.
+        This looks at the compositor of the screens, which is private to Textual. If that
+        changes in a Textual version, this returns True, so the animation keeps running."""
+
+        try:
+            screen = self.screen
+        except NoScreen:
+            return False
+        if not screen.is_current:
+            return False
+        try:
+            visible = screen._compositor.visible_widgets  # type: ignore[unused-ignore]
+            if self not in visible:
+                return False
+            region, clip = visible[self]
+            shown = region.intersection(clip)
+            stack = self.app.screen_stack
+            for above in stack[stack.index(screen) + 1 :]:
+                for widget, (region, clip) in above._compositor.visible_widgets.items():  # type: ignore[unused-ignore]
+                    if widget.styles.background.a == 1 and region.intersection(clip).contains_region(shown):
+                        return False
+        except AttributeError:
+            return True
+        return True
+
+    def _pause_animation(self) -> None:
+
+        if self.auto_refresh is not None:
+            self._paused_at = (time.monotonic(), self.auto_refresh)
+            self.auto_refresh = None
+
+    def _resume_animation(self) -> None:
+
+        if self._paused_at is None:
+            return
+        paused_at, interval = self._paused_at
+        self._paused_at = None
+        self._advance_frames(int((time.monotonic() - paused_at) / interval))  # Catch up on the frames.
+        self.auto_refresh = interval
+        self.refresh()
+
+    def _screen_layout_refreshed(self, screen: Screen[object]) -> None:
+        """Called when the screen is scrolled, or its layout changes, or it is shown again."""
+
+        if self._paused_at is not None and self.can_be_seen():
+            self._resume_animation()
+
+    def _current_frame(self) -> list[Strip]:
+        """Return the strips of the current frame. The styled strips of every frame are built
+        once for each render, set of colors and width."""
+
+        key = self._current_frames_key()
+        if self._frames is None or self._frames_key != key:
+            _, width, keep_spaces = key
+            self._frames = FrameCycle(
+                self._animation_lines,
+                self._line_colors,
+                self.animation_type,
+                self.horizontal,
+                width,
+                keep_spaces=keep_spaces,
+            )
+            self._frames_key = key
+        return self._frames.frame(self._frame_phase)
+
+    def _current_frames_key(self) -> tuple[int, int, bool]:
+        """The frames are built again when the render, the colors, the width, or whether the
+        CSS `text-style` of the widget shows on spaces (an underline, for instance) change."""
+
+        return (self._style_version, self.size.width, self._keep_spaces)
+
+    def frame_bytes(self) -> int:
+        """Return how many bytes the current frame takes to send to a truecolor terminal,
+        not counting the styles that Textual adds (such as the background of the widget).
+        This is the cost of every animation frame of the widget."""
+
+        if self.repeat:
+            return frame_bytes(super().render_line(y) for y in range(self.size.height))
+        return frame_bytes(self._current_frame())
+
+    #! OVERRIDE
+    def render_lines(self, crop: Region) -> list[Strip]:
+        """Check the CSS `text-style` once for each paint, rather than for every line."""
+
+        self._keep_spaces = text_style_shows_spaces(self.rich_style)
+        return super().render_lines(crop)
+
+    #! OVERRIDE
+    def render_line(self, y: int) -> Strip:
+        """Line requests are answered from the strips of the current frame."""
+
+        if self.repeat:
+            return super().render_line(y)
+
+        strips = self._current_frame()
+        if y < len(strips):
+            return strips[y]
+        return Strip.blank(self.size.width)
@@ -0,0 +1,301 @@
+"""Module for the FontIndex class.
+
+The font index is a small binary file with the metadata of every font: height, baseline,
+widest glyph, print direction, smushing mode, and which characters the font covers.
+It is built ahead of time by `scripts/make_fonts_list.py` (or `build_index()`), next to
+the font pack. Opening it reads the file in one go, and the metadata of a font is only
+decoded when it is asked for, so tools can filter the fonts without loading any of them:
+
+```
+from textual_pyfiglet.font_index import FontIndex
+
+index = FontIndex.open_default()
+small_fonts = [font for font in index.names() if index.info(font).height <= 4]
+readable = index.fonts_covering("Hello 123")
+```
+
+File layout (all integers little-endian):
+
+```
+header:  magic "TPFI" | format version (u16) | font count (u32) | names length (u32)
+         | pyfiglet version (u16 length + utf-8)
+names:   every font name, utf-8, joined by NUL
+records: for each font: height (u16) | baseline (u16) | max width (u16) | print direction (i8,
+         -1 = not set) | padding (1) | smush mode (i32) | extras offset (u32) | extras count (u32)
+         | coverage of code points 0-255 (32 byte bitset)
+extras:  the covered code points above 255 (u32 each, sorted)
+```
+"""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+# Other library imports
+from pyfiglet.version import __version__ as pyfiglet_version
+
+# Local imports
+from textual_pyfiglet._atomic import atomic_write
+from textual_pyfiglet.font_registry import GlyphTable, font_registry
+
+MAGIC = b"TPFI"
+FORMAT_VERSION = 1
+DEFAULT_INDEX_PATH = Path(__file__).with_name("fonts.index")
+
+_HEADER = struct.Struct("<4sHII")
+_LENGTH = struct.Struct("<H")
+_RECORD = struct.Struct("<HHHbxiII32s")
+
+
+class FontIndexError(Exception):
+    """Raised when a font index file is corrupt, or was built for another version."""
+
+
+class FontInfo(NamedTuple):
+    """The metadata of a font, as stored in the font index."""
+
+    name: str
+    height: int
+    "Height of every glyph, in lines."
+    baseline: int
+    "Height of the glyphs not counting the descenders."
+    max_width: int
+    "Width of the widest glyph, in characters."
+    print_direction: int | None
+    "0 for left-to-right, 1 for right-to-left, or None if the font does not specify it."
+    smush_mode: int
+    "The full layout (smushing) mode of the font."
+    coverage: bytes
+    "Bitset of the covered code points 0-255. Bit `n % 8` of byte `n // 8` is code point n."
+    extra_code_points: tuple[int, ...]
+    "The covered code points above 255, sorted."
+
+    @classmethod
+    def from_glyph_table(cls, table: GlyphTable) -> FontInfo:
+        """Collect the metadata of a loaded font.
+
+        Args:
+            table: The GlyphTable of the font."""
+
+        coverage = bytearray(32)
+        extras: list[int] = []
+        for code in table.chars:
+            if 0 <= code < 256:
+                coverage[code >> 3] |= 1 << (code & 7)
+            elif code > 255:
+                extras.append(code)
+
+        return cls(
+            table.font,
+            table.height,
+            table.baseline,
+            max(table.width.values(), default=0),
+            table.printDirection,
+            table.smushMode,
+            bytes(coverage),
+            tuple(sorted(extras)),
+        )
+
+    def covers(self, text: str) -> bool:
+        """Return True if the font has a glyph for every character of the text. Newlines
+        are ignored. Pyfiglet skips characters that the font does not have."""
+
+        coverage, extras = self.coverage, self.extra_code_points
+        for char in set(text) - {"\n"}:
+            code = ord(char)
+            if code < 256:
+                if not coverage[code >> 3] & (1 << (code & 7)):
+                    return False
+            else:
+                i = bisect_left(extras, code)
+                if i == len(extras) or extras[i] != code:
+                    return False
+        return True
+
+    def code_points(self) -> list[int]:
+        """Return every covered code point, sorted."""
+
+        low = [code for code in range(256) if self.coverage[code >> 3] & (1 << (code & 7))]
+        return low + list(self.extra_code_points)
+
+
+class FontIndex:
+    """A read-only font index. See the module docstring for the file layout."""
+
+    def __init__(self, path: str | os.PathLike[str] = DEFAULT_INDEX_PATH) -> None:
+        """Open a font index.
+
+        Args:
+            path: Path to the index file. Defaults to the index that ships inside the package.
+        Raises:
+            FontIndexError: If the file is not a valid font index.
+            OSError: If the file cannot be read."""
+
+        self.path = Path(path)
+        self._data = self.path.read_bytes()
+        try:
+            magic, version, count, names_length = _HEADER.unpack_from(self._data, 0)
+            if magic != MAGIC:
+                raise FontIndexError(f"{self.path} is not a font index.")
+            if version != FORMAT_VERSION:
+                raise FontIndexError(
+                    f"Font index {self.path} is format {version}, expected {FORMAT_VERSION}."
+                )
+
+            position = _HEADER.size
+            (length,) = _LENGTH.unpack_from(self._data, position)
+            position += _LENGTH.size
+            self.pyfiglet_version = self._data[position : position + length].decode("utf-8")
+            position += length
+
+            names = (
+                self._data[position : position + names_length].decode("utf-8").split("\0") if count else []
+            )
+            self._records_start = position + names_length
+        except (struct.error, UnicodeDecodeError) as e:
+            raise FontIndexError(f"Font index {self.path} is corrupt: {e}") from e
+
+        if len(names) != count or self._records_start + count * _RECORD.size > len(self._data):
+            raise FontIndexError(f"Font index {self.path} is corrupt: truncated.")
+        self._positions = {name: i for i, name in enumerate(names)}
+        self._extras_start = self._records_start + count * _RECORD.size
+
+    def __contains__(self, font: object) -> bool:
+        return font in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @classmethod
+    def open_default(cls) -> FontIndex | None:
+        """Open the index that ships inside the package. Returns None if the package does
+        not have one, or if it was built from a different version of Pyfiglet."""
+
+        try:
+            index = cls(DEFAULT_INDEX_PATH)
+        except (OSError, FontIndexError):
+            return None
+        if index.pyfiglet_version != pyfiglet_version:
+            return None
+        return index
+
+    def names(self) -> list[str]:
+        """Return the names of all the fonts in the index."""
+
+        return list(self._positions)
+
+    def info(self, font: str) -> FontInfo:
+        """Decode the metadata of a font.
+
+        Args:
+            font: Name of the font.
+        Raises:
+            KeyError: If the font is not in the index."""
+
+        offset = self._records_start + self._positions[font] * _RECORD.size
+        height, baseline, max_width, direction, smush_mode, extras_offset, extras_count, coverage = (
+            _RECORD.unpack_from(self._data, offset)
+        )
+        start = self._extras_start + extras_offset * 4
+        extras = array("I")
+        extras.frombytes(self._data[start : start + extras_count * 4])
+        if sys.byteorder == "big":
+            extras.byteswap()
+
+        return FontInfo(
+            font,
+            height,
+            baseline,
+            max_width,
+            None if direction == -1 else direction,
+            smush_mode,
+            coverage,
+            tuple(extras),
+        )
+
+    def fonts_covering(self, text: str) -> list[str]:
+        """Return the names of the fonts that have a glyph for every character of the text.
+
+        Args:
+            text: The characters to check for."""
+
+        return [font for font in self._positions if self.info(font).covers(text)]
+
+
+_default_index: FontIndex | None = None
+_default_checked = False
+
+
+def font_info(font: str) -> FontInfo:
+    """Return the metadata of a font. It comes from the font index when the package ships
+    one, otherwise the font is loaded with the font registry.
+
+    Args:
+        font: Name of the font.
+    Raises:
+        FontNotFound: If the font is not in the index and Pyfiglet cannot find it."""
+
+    global _default_index, _default_checked
+
+    if not _default_checked:
+        _default_index = FontIndex.open_default()
+        _default_checked = True
+    if _default_index is not None and font in _default_index:
+        return _default_index.info(font)
+    return FontInfo.from_glyph_table(font_registry.get(font))
+
+
+def build_index(
+    path: str | os.PathLike[str] = DEFAULT_INDEX_PATH,
+    fonts: Iterable[str] | None = None,
+) -> int:
+    """Write the font index. The file is written atomically.
+
+    Args:
+        path: Where to write the index. Defaults to the index location inside the package.
+        fonts: Names of the fonts to include. Defaults to every font in ALL_FONTS.
+    Returns:
+        The number of fonts written to the index."""
+
+    if fonts is None:
+        from typing import get_args
+        from textual_pyfiglet.fonts_list import ALL_FONTS
+
+        fonts = get_args(ALL_FONTS)
+
+    infos = {font: FontInfo.from_glyph_table(font_registry.get(font)) for font in fonts}
+    names = "\0".join(infos).encode("utf-8")
+    version = pyfiglet_version.encode("utf-8")
+
+    records = bytearray()
+    extras = array("I")
+    for info in infos.values():
+        records += _RECORD.pack(
+            info.height,
+            info.baseline,
+            info.max_width,
+            -1 if info.print_direction is None else info.print_direction,
+            info.smush_mode,
+            len(extras),
+            len(info.extra_code_points),
+            info.coverage,
+        )
+        extras.extend(info.extra_code_points)
+    if sys.byteorder == "big":
+        extras.byteswap()
+
+    data = _HEADER.pack(MAGIC, FORMAT_VERSION, len(infos), len(names))
+    data += _LENGTH.pack(len(version)) + version + names + records + extras.tobytes()
+    atomic_write(path, bytes(data), mode=0o644)
+
+    return len(infos)
@@ -0,0 +1,269 @@
+"""Module for the FontPack class.
+
+A font pack is a single binary file that holds every Pyfiglet font in pre-parsed form.
+It is built ahead of time by `scripts/make_fonts_list.py` (or `build_pack()`), and
+at runtime it is memory-mapped, so loading a font only decodes that font's record.
+There is no text parsing involved. Several processes that use the same pack also
+share the same physical pages of memory.
+
+File layout (all integers little-endian):
+
+```
+header:  magic "TPFP" | format version (u16) | font count (u32) | pyfiglet version (u16 length + utf-8)
+index:   for each font: name (u16 length + utf-8) | record offset (u64) | record length (u32)
+records: height (u16) | baseline (u16) | max length (u16) | print direction (i8, -1 = not set)
+         | padding (1) | smush mode (i32) | glyph count (u32) | strings length (u32)
+         | code points (u32 * glyph count) | widths (u16 * glyph count)
+         | strings: hard blank and every glyph line, utf-8, joined by NUL
+```
+"""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable
+
+# Other library imports
+from pyfiglet.version import __version__ as pyfiglet_version
+
+# Local imports
+from textual_pyfiglet._atomic import atomic_write
+from textual_pyfiglet.font_registry import GlyphTable
+
+MAGIC = b"TPFP"
+FORMAT_VERSION = 1
+DEFAULT_PACK_PATH = Path(__file__).with_name("fonts.pack")
+
+_HEADER = struct.Struct("<4sHI")
+_LENGTH = struct.Struct("<H")
+_INDEX_ENTRY = struct.Struct("<QI")
+_RECORD = struct.Struct("<HHHbxiII")
+
+
+class FontPackError(Exception):
+    """Raised when a font pack file is missing, corrupt, or was built for another version."""
+
+
+class FontPack:
+    """A read-only, memory-mapped font pack.
+
+    Opening a pack only reads its index. Fonts are decoded from the mapped file on demand
+    by `load()`."""
+
+    def __init__(self, path: str | os.PathLike[str] = DEFAULT_PACK_PATH) -> None:
+        """Open a font pack.
+
+        Args:
+            path: Path to the pack file. Defaults to the pack that ships inside the package.
+        Raises:
+            FontPackError: If the file is not a valid font pack.
+            OSError: If the file cannot be opened."""
+
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._index, self.pyfiglet_version = self._read_index()
+        except (struct.error, UnicodeDecodeError) as e:
+            self.close()
+            raise FontPackError(f"Font pack {self.path} is corrupt: {e}") from e
+        except FontPackError:
+            self.close()
+            raise
+
+    def __contains__(self, font: object) -> bool:
+        return font in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __enter__(self) -> FontPack:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @classmethod
+    def open_default(cls) -> FontPack | None:
+        """Open the pack that ships inside the package. Returns None if the package does
+        not have one, or if it was built from a different version of Pyfiglet (in which
+        case its fonts might not match the installed ones)."""
+
+        try:
+            pack = cls(DEFAULT_PACK_PATH)
+        except (OSError, ValueError, FontPackError):  # mmap raises ValueError on empty files.
+            return None
+        if pack.pyfiglet_version != pyfiglet_version:
+            pack.close()
+            return None
+        return pack
+
+    def names(self) -> list[str]:
+        """Return the names of all the fonts in the pack."""
+
+        return list(self._index)
+
+    def load(self, font: str) -> GlyphTable:
+        """Decode a font from the pack.
+
+        Args:
+            font: Name of the font.
+        Raises:
+            KeyError: If the font is not in the pack."""
+
+        offset, length = self._index[font]
+        record = memoryview(self._mmap)[offset : offset + length]
+        try:
+            height, baseline, max_length, print_direction, smush_mode, count, strings_length = (
+                _RECORD.unpack_from(record)
+            )
+            position = _RECORD.size
+            codes = array("I")
+            codes.frombytes(record[position : position + 4 * count])
+            position += 4 * count
+            widths = array("H")
+            widths.frombytes(record[position : position + 2 * count])
+            position += 2 * count
+            strings = str(record[position : position + strings_length], "utf-8").split("\0")
+        finally:
+            record.release()
+
+        if sys.byteorder == "big":
+            codes.byteswap()
+            widths.byteswap()
+
+        hard_blank = strings[0]
+        chars: dict[int, tuple[str, ...]] = {}
+        for i, code in enumerate(codes):
+            start = 1 + i * height
+            chars[code] = tuple(strings[start : start + height])
+
+        return GlyphTable(
+            font,
+            hard_blank=hard_blank,
+            height=height,
+            baseline=baseline,
+            max_length=max_length,
+            print_direction=None if print_direction == -1 else print_direction,
+            smush_mode=smush_mode,
+            chars=chars,
+            widths=dict(zip(codes, widths)),
+        )
+
+    def close(self) -> None:
+        """Unmap the pack file. Fonts that were already loaded remain usable."""
+
+        self._mmap.close()
+
+    def _read_index(self) -> tuple[dict[str, tuple[int, int]], str]:
+
+        magic, version, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise FontPackError(f"{self.path} is not a font pack.")
+        if version != FORMAT_VERSION:
+            raise FontPackError(f"Font pack {self.path} is format {version}, expected {FORMAT_VERSION}.")
+
+        position = _HEADER.size
+        built_with, position = _read_string(self._mmap, position)
+
+        index: dict[str, tuple[int, int]] = {}
+        for _ in range(count):
+            name, position = _read_string(self._mmap, position)
+            offset, length = _INDEX_ENTRY.unpack_from(self._mmap, position)
+            position += _INDEX_ENTRY.size
+            index[name] = (offset, length)
+
+        return index, built_with
+
+
+def build_pack(
+    path: str | os.PathLike[str] = DEFAULT_PACK_PATH,
+    fonts: Iterable[str] | None = None,
+) -> int:
+    """Compile fonts into a font pack. The file is written atomically, so processes that
+    have the old pack mapped are not affected.
+
+    Args:
+        path: Where to write the pack. Defaults to the pack location inside the package.
+        fonts: Names of the fonts to include. Defaults to every font in ALL_FONTS.
+    Returns:
+        The number of fonts written to the pack.
+    Raises:
+        FontPackError: If a font contains a NUL character (which is used as the separator)."""
+
+    if fonts is None:
+        from typing import get_args
+        from textual_pyfiglet.fonts_list import ALL_FONTS
+
+        fonts = get_args(ALL_FONTS)
+
+    records: dict[str, bytes] = {}
+    for font in fonts:
+        if font not in records:
+            records[font] = _encode_record(GlyphTable.load(font))
+
+    header = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, len(records)))
+    header += _encode_string(pyfiglet_version)
+    index_size = sum(len(_encode_string(name)) + _INDEX_ENTRY.size for name in records)
+
+    offset = len(header) + index_size
+    index = bytearray()
+    for name, record in records.items():
+        index += _encode_string(name)
+        index += _INDEX_ENTRY.pack(offset, len(record))
+        offset += len(record)
+
+    atomic_write(path, bytes(header + index + b"".join(records.values())), mode=0o644)
+
+    return len(records)
+
+
+def _encode_record(table: GlyphTable) -> bytes:
+
+    codes = array("I", table.chars.keys())
+    widths = array("H", (table.width[code] for code in codes))
+    strings = [table.hardBlank]
+    for code in codes:
+        strings.extend(table.chars[code])
+    if any("\0" in string for string in strings):
+        raise FontPackError(f"Font {table.font} contains a NUL character and cannot be packed.")
+    blob = "\0".join(strings).encode("utf-8")
+
+    if sys.byteorder == "big":
+        codes.byteswap()
+        widths.byteswap()
+
+    print_direction = -1 if table.printDirection is None else table.printDirection
+    header = _RECORD.pack(
+        table.height,
+        table.baseline,
+        table.max_length,
+        print_direction,
+        table.smushMode,
+        len(codes),
+        len(blob),
+    )
+    return header + codes.tobytes() + widths.tobytes() + blob
+
+
+def _encode_string(string: str) -> bytes:
+
+    encoded = string.encode("utf-8")
+    return _LENGTH.pack(len(encoded)) + encoded
+
+
+def _read_string(buffer: mmap.mmap, position: int) -> tuple[str, int]:
+
+    (length,) = _LENGTH.unpack_from(buffer, position)
+    position += _LENGTH.size
+    return buffer[position : position + length].decode("utf-8"), position + length
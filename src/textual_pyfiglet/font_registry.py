@@ -0,0 +1,228 @@
+"""Module for the FontRegistry and GlyphTable classes.
+
+Pyfiglet reads and parses a font file every time `Figlet.setFont` is called. The
+font registry parses each font once per process and hands the same immutable
+GlyphTable to every FigletWidget (and to `FigletWidget.figlet_quick`)."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import threading
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
+
+# Other library imports
+from pyfiglet import FigletFont
+
+if TYPE_CHECKING:
+    from textual_pyfiglet.font_pack import FontPack
+
+
+class GlyphTable(FigletFont):
+    """An immutable, already parsed Figlet font.
+
+    This is a drop-in replacement for Pyfiglet's FigletFont (It can be set as `Figlet.Font`),
+    but it does not read or parse anything when it is created. The glyphs are stored in
+    read-only mappings, and setting any attribute after creation raises an AttributeError,
+    so a single GlyphTable can be safely shared between any number of widgets and threads."""
+
+    chars: Mapping[int, tuple[str, ...]]  # type: ignore[assignment]
+    width: Mapping[int, int]  # type: ignore[assignment]
+    baseline: int
+    max_length: int
+
+    def __init__(
+        self,
+        font: str,
+        *,
+        hard_blank: str,
+        height: int,
+        baseline: int,
+        max_length: int,
+        print_direction: int | None,
+        smush_mode: int,
+        chars: Mapping[int, tuple[str, ...]],
+        widths: Mapping[int, int],
+        comment: str = "",
+    ) -> None:
+        """Create a GlyphTable. Normally you do not need to do this yourself, use
+        `font_registry.get()` or `GlyphTable.from_figlet_font()` instead.
+
+        Args:
+            font: Name of the font.
+            hard_blank: The hard blank character of the font.
+            height: Height of every glyph, in lines.
+            baseline: Height of the glyphs not counting the descenders.
+            max_length: Maximum length of a glyph line in the font file (including end markers).
+            print_direction: 0 for left-to-right, 1 for right-to-left, or None if the font
+                does not specify it.
+            smush_mode: The full layout (smushing) mode of the font.
+            chars: Mapping of code point to the lines of that glyph.
+            widths: Mapping of code point to the width of that glyph.
+            comment: The comment section of the font file.
+        """
+        # NOTE: FigletFont.__init__ is intentionally not called. It would load
+        # and parse the font file, which is the whole thing this class avoids.
+        set_attr = super().__setattr__
+        set_attr("font", font)
+        set_attr("comment", comment)
+        set_attr("data", "")
+        set_attr("hardBlank", hard_blank)
+        set_attr("height", height)
+        set_attr("baseline", baseline)
+        set_attr("max_length", max_length)
+        set_attr("printDirection", print_direction)
+        set_attr("smushMode", smush_mode)
+        set_attr("chars", MappingProxyType(dict(chars)))
+        set_attr("width", MappingProxyType(dict(widths)))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"GlyphTable is immutable (tried to set '{name}').")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"GlyphTable is immutable (tried to delete '{name}').")
+
+    def __repr__(self) -> str:
+        return f"<GlyphTable {self.font!r}: {len(self.chars)} glyphs, height {self.height}>"
+
+    @classmethod
+    def from_figlet_font(cls, figlet_font: FigletFont) -> GlyphTable:
+        """Freeze a font that was loaded by Pyfiglet into a GlyphTable.
+
+        Args:
+            figlet_font: A loaded Pyfiglet FigletFont."""
+
+        # FigletFont does not keep the baseline or max length, but they're
+        # still in the header line of the raw font data.
+        header = FigletFont.reMagicNumber.sub("", figlet_font.data.split("\n", 1)[0]).split()
+
+        return cls(
+            figlet_font.font,
+            hard_blank=figlet_font.hardBlank,
+            height=figlet_font.height,
+            baseline=int(header[2]),
+            max_length=int(header[3]),
+            print_direction=figlet_font.printDirection,
+            smush_mode=figlet_font.smushMode,
+            chars={code: tuple(lines) for code, lines in figlet_font.chars.items()},
+            widths=figlet_font.width,
+            comment=figlet_font.comment,
+        )
+
+    @classmethod
+    def load(cls, font: str) -> GlyphTable:
+        """Read and parse a font with Pyfiglet, and freeze it into a GlyphTable.
+
+        Args:
+            font: Name of the font to load.
+        Raises:
+            FontNotFound: If Pyfiglet cannot find the font.
+            FontError: If Pyfiglet cannot parse the font."""
+
+        return cls.from_figlet_font(FigletFont(font))
+
+
+class FontRegistry:
+    """A thread-safe, process-wide registry of parsed fonts.
+
+    Every font is loaded once, the first time it is requested. After that `get()` returns
+    the same GlyphTable object to every caller.
+
+    Fonts are decoded from the pre-compiled font pack when the package ships one
+    (see `font_pack.py`). Otherwise, or for fonts that are not in the pack, they are
+    parsed from the font files by Pyfiglet."""
+
+    def __init__(self, use_pack: bool = True) -> None:
+        """Create a FontRegistry.
+
+        Args:
+            use_pack: Whether to load fonts from the font pack when one is available."""
+
+        self._fonts: dict[str, GlyphTable] = {}
+        self._lock = threading.Lock()
+        self._font_locks: dict[str, threading.Lock] = {}
+        self._use_pack = use_pack
+        self._pack: FontPack | None = None
+        self._pack_checked = False
+
+    def __contains__(self, font: object) -> bool:
+        return font in self._fonts
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+    def get(self, font: str) -> GlyphTable:
+        """Get the parsed GlyphTable for a font, loading it on first use.
+
+        Two threads asking for the same font at the same time will only load it once.
+        Threads asking for different fonts do not block each other.
+
+        Args:
+            font: Name of the font.
+        Raises:
+            FontNotFound: If Pyfiglet cannot find the font.
+            FontError: If Pyfiglet cannot parse the font."""
+
+        try:
+            return self._fonts[font]  # Fast path, no locking needed once it's resident.
+        except KeyError:
+            pass
+
+        with self._lock:
+            font_lock = self._font_locks.setdefault(font, threading.Lock())
+
+        with font_lock:
+            try:
+                return self._fonts[font]  # Another thread may have loaded it while we waited.
+            except KeyError:
+                table = self._load(font)
+                self._fonts[font] = table
+                return table
+
+    def resident_fonts(self) -> list[str]:
+        """Return the names of all the fonts that are currently loaded, in load order."""
+
+        return list(self._fonts)
+
+    def evict(self, font: str) -> None:
+        """Remove a font from the registry. It will be loaded again the next time it
+        is requested. Widgets that are already using it keep their copy.
+
+        Args:
+            font: Name of the font to remove."""
+
+        with self._lock:
+            self._fonts.pop(font, None)
+
+    def clear(self) -> None:
+        """Remove all fonts from the registry."""
+
+        with self._lock:
+            self._fonts.clear()
+
+    @property
+    def pack(self) -> FontPack | None:
+        """The font pack that fonts are loaded from, or None if there is no usable pack."""
+
+        if not self._pack_checked and self._use_pack:
+            with self._lock:
+                if not self._pack_checked:
+                    from textual_pyfiglet.font_pack import FontPack
+
+                    self._pack = FontPack.open_default()
+                    self._pack_checked = True
+        return self._pack
+
+    def _load(self, font: str) -> GlyphTable:
+
+        pack = self.pack
+        if pack is not None and font in pack:
+            return pack.load(font)
+        return GlyphTable.load(font)
+
+
+font_registry = FontRegistry()
+"The process-wide font registry shared by all FigletWidgets."
@@ -0,0 +1,401 @@
+"""Module for predicting the size of a render without rendering it.
+
+Pyfiglet builds every row of the render as a string, and makes a new copy of each
+row for every character. To know how big a render will be, most of that is not needed:
+how far the next character can be smushed only depends on the edge of each row (its
+length, and its last character that is not a space), and smushing two characters
+together only ever happens at that edge. The MeasuringBuilder keeps only that (plus
+which columns of each row are visible, for trimming), and re-uses Pyfiglet's own
+builder logic for everything else (wrapping, smushing rules, justification), so the
+sizes always agree with the real render.
+
+```
+from textual_pyfiglet.measure import measure
+
+width, height = measure("My Banner", font="slant", width=80)
+```
+
+This module does not depend on Textual."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple, Tuple, Optional
+
+# Other library imports
+from pyfiglet import CharNotPrinted, FigletFont
+
+# Local imports
+from textual_pyfiglet.renderer import JUSTIFY_OPTIONS, CustomFiglet, ResumableBuilder, trim_render
+
+if TYPE_CHECKING:
+    from textual_pyfiglet.fonts_list import ALL_FONTS
+
+Span = Optional[Tuple[int, int]]
+"First and last index of a range of columns, or None if the range is empty."
+
+
+class Measurement(NamedTuple):
+    """The size of a render, as the FigletWidget would display it."""
+
+    width: int
+    "Width of the widest line, in characters."
+    height: int
+    "Number of lines."
+
+
+class _Row:
+    """What the MeasuringBuilder knows about a row of the buffer.
+
+    For right-to-left text, characters are added to the start of a row instead of the
+    end, so the row is stored reversed (and so are all the indexes)."""
+
+    __slots__ = ("length", "last", "last_char", "solid", "ink", "text")
+
+    def __init__(
+        self,
+        length: int = 0,
+        last: int = -1,
+        last_char: str = "",
+        solid: Span = None,
+        ink: Span = None,
+        text: str = "",
+    ) -> None:
+        self.length = length
+        self.last = last  # Index of the last character that is not a space, or -1.
+        self.last_char = last_char
+        self.solid = solid  # Span of the characters that are not a space or a hard blank.
+        self.ink = ink  # Span of the characters that are not whitespace or a hard blank.
+        self.text = text  # The whole row. Only kept for irregular fonts.
+
+    def __len__(self) -> int:
+        return self.length
+
+
+@lru_cache(maxsize=64)
+def _font_profile(font: FigletFont) -> tuple[bool, bool]:
+    """Return whether a font is regular, and whether any of its glyphs contain line breaks.
+
+    In a regular font, every glyph row is exactly as wide as the glyph, and there is no
+    whitespace other than spaces. For those fonts, smushing two characters together only
+    happens at the edge of a row, and a visible character is never smushed into an invisible
+    one, so the builder does not need to keep the rows. Other fonts keep the whole rows."""
+
+    regular = True
+    line_breaks = False
+    for code, rows in font.chars.items():
+        width = font.width[code]
+        for row in rows:
+            if len(row) != width or any(char.isspace() and char != " " for char in row):
+                regular = False
+            if len(row.splitlines()) > 1 or row.endswith(("\r", "\n")):
+                line_breaks = True
+    return regular, line_breaks
+
+
+def _spans(row: str, hard_blank: str) -> tuple[Span, Span]:
+    """Return the solid span and the ink span of a row."""
+
+    shown = row.replace(hard_blank, " ")
+    solid_start = shown.lstrip(" ")
+    if not solid_start:
+        return None, None
+    solid = (len(shown) - len(solid_start), len(shown.rstrip(" ")) - 1)
+    ink_start = solid_start.lstrip()
+    if not ink_start:
+        return solid, None
+    return solid, (len(shown) - len(ink_start), len(shown.rstrip()) - 1)
+
+
+def _union(old: Span, new: Span, offset: int) -> Span:
+    if new is None:
+        return old
+    if old is None:
+        return new[0] + offset, new[1] + offset
+    return min(old[0], new[0] + offset), max(old[1], new[1] + offset)
+
+
+class MeasuringBuilder(ResumableBuilder):
+    """A FigletBuilder that only keeps the edges of the buffer rows. The product is a list
+    of blocks of `_Row`s instead of strings, with the same lengths as a real render."""
+
+    buffer: list[Any]
+
+    def __init__(self, text: str, font: FigletFont, direction: str, width: int, justify: str) -> None:
+        super().__init__(text, font, direction, width, justify)
+        self.regular = _font_profile(font)[0]
+        self.rtl = direction == "right-to-left"
+        self.buffer = [_Row() for _ in range(font.height)]
+        self.widest_char = 0
+        self._glyph_rows: dict[str, tuple[int, int, str, Span, Span]] = {}
+
+    def blocks(self) -> list[list[_Row]]:
+        """Return the rows of every block of the render so far, including the one in progress."""
+
+        blocks: list[list[_Row]] = list(self.product.queue)  # type: ignore[arg-type]
+        if len(self.buffer[0]) > 0:  # Same check as Pyfiglet's returnProduct.
+            blocks.append(self.buffer)
+        return blocks
+
+    def lines(self) -> list[tuple[int, Span, Span]]:
+        """Return (length, solid span, ink span) of every line of the finished render, in
+        the same order and with the same justification as the lines of the real render."""
+
+        lines: list[tuple[int, Span, Span]] = []
+        for block in self.blocks():
+            for row in block:
+                if self.justify == "right":
+                    pad = max(self.width - row.length - 1, 0)
+                elif self.justify == "center":
+                    pad = max(int((self.width - row.length) / 2), 0)
+                else:
+                    pad = 0
+                solid, ink = row.solid, row.ink
+                if self.rtl:  # The row is stored reversed.
+                    solid = None if solid is None else (row.length - 1 - solid[1], row.length - 1 - solid[0])
+                    ink = None if ink is None else (row.length - 1 - ink[1], row.length - 1 - ink[0])
+                lines.append((pad + row.length, _union(None, solid, pad), _union(None, ink, pad)))
+        return lines
+
+    #! OVERRIDE
+    def addCharToProduct(self) -> None:
+        width = self.getCurWidth()  # type: ignore[no-untyped-call]
+        if width is not None:
+            self.widest_char = max(self.widest_char, width)
+        super().addCharToProduct()  # type: ignore[no-untyped-call]
+
+    #! OVERRIDE
+    def cutBufferCommon(self) -> None:
+        # Same as Pyfiglet's version, with an empty buffer of _Rows.
+        self.currentTotalWidth = 0
+        self.buffer = [_Row() for _ in range(self.font.height)]
+        self.blankMarkers = list()
+        self.prevCharWidth = 0
+        curChar = self.getCurChar()
+        if curChar is None:
+            return
+        self.maxSmush = self.currentSmushAmount(curChar)
+
+    #! OVERRIDE
+    def cutBufferAtLastChar(self) -> None:
+        if all(row.length == 0 for row in self.buffer):
+            # Pyfiglet would start a new line with the same character forever.
+            raise CharNotPrinted("Width is not enough to print this character")
+        super().cutBufferAtLastChar()  # type: ignore[no-untyped-call]
+
+    #! OVERRIDE
+    def smushAmount(self, buffer: list[str] = [], curChar: list[str] = []) -> int:
+        # Same as Pyfiglet's version, with the edge of the buffer row taken from the _Row.
+
+        if (self.font.smushMode & (self.SM_SMUSH | self.SM_KERN)) == 0:
+            return 0
+
+        max_smush: int = self.curCharWidth
+        for row in range(0, self.font.height):
+            state: _Row = buffer[row]  # type: ignore[assignment]
+            glyph_row = curChar[row]
+            if self.rtl:  # The glyph is on the left, the buffer on the right.
+                linebd = max(len(glyph_row.rstrip(" ")) - 1, 0)
+                if linebd < len(glyph_row):
+                    ch1 = glyph_row[linebd]
+                else:
+                    linebd, ch1 = 0, ""
+                if state.last >= 0:
+                    charbd, ch2 = state.length - 1 - state.last, state.last_char
+                else:
+                    charbd, ch2 = state.length, ""
+                amount = charbd + len(glyph_row) - 1 - linebd
+            else:
+                linebd = max(state.last, 0)
+                if linebd < state.length:
+                    ch1 = state.last_char if state.last >= 0 else " "
+                else:
+                    linebd, ch1 = 0, ""
+                charbd = len(glyph_row) - len(glyph_row.lstrip(" "))
+                ch2 = glyph_row[charbd] if charbd < len(glyph_row) else ""
+                amount = charbd + state.length - 1 - linebd
+
+            if ch1 == "" or ch1 == " ":
+                amount += 1
+            elif ch2 != "" and self.smushChars(left=ch1, right=ch2) is not None:
+                amount += 1
+
+            if amount < max_smush:
+                max_smush = amount
+
+        return max_smush
+
+    #! OVERRIDE
+    def addCurCharRowToBufferRow(self, curChar: list[str], row: int) -> None:
+
+        if not self.regular:
+            self._add_row_text(curChar[row], row)
+            return
+
+        state: _Row = self.buffer[row]
+        glyph_row = curChar[row]
+        smush = self.maxSmush
+        if self.rtl and smush > state.length:
+            raise IndexError("string index out of range")  # Same as Pyfiglet's smushRow.
+
+        info = self._glyph_rows.get(glyph_row)
+        if info is None:
+            info = self._glyph_row_info(glyph_row)
+        length, last, last_char, solid, ink = info
+
+        # The glyph row starts at `offset`. Where it overlaps the buffer row, only one column
+        # can have a character that is not a space on both sides: the last one of the buffer.
+        offset = state.length - smush
+        if last >= 0 and offset + last >= state.last:
+            if offset + last == state.last:
+                if self.rtl:
+                    smushed = self.smushChars(left=last_char, right=state.last_char)
+                else:
+                    smushed = self.smushChars(left=state.last_char, right=last_char)
+                if smushed is None:  # Pyfiglet fails to join the row in this case.
+                    raise TypeError("expected str instance, NoneType found")
+                last_char = smushed
+            last += offset
+        else:
+            last, last_char = state.last, state.last_char
+
+        self.buffer[row] = _Row(
+            max(state.length, offset + length),
+            last,
+            last_char,
+            _union(state.solid, solid, offset),
+            _union(state.ink, ink, offset),
+        )
+
+    def _glyph_row_info(self, glyph_row: str) -> tuple[int, int, str, Span, Span]:
+
+        stored = glyph_row[::-1] if self.rtl else glyph_row
+        stripped = stored.rstrip(" ")
+        info = (len(stored), len(stripped) - 1, stripped[-1:], *_spans(stored, self.font.hardBlank))
+        self._glyph_rows[glyph_row] = info
+        return info
+
+    def _add_row_text(self, glyph_row: str, row: int) -> None:
+        """Add a glyph row to a buffer row that keeps its whole text. This is the same as
+        Pyfiglet's addCurCharRowToBufferRow, with the right-to-left rows stored reversed."""
+
+        smush_chars: Any = self.smushChars
+        text = self.buffer[row].text
+        smush = self.maxSmush
+        if self.rtl:
+            start = len(glyph_row) - smush
+            glyph = list(glyph_row)
+            if smush > len(text):
+                raise IndexError("string index out of range")  # Same as Pyfiglet's smushRow.
+            for i in range(smush):
+                left = glyph_row[start + i] if start + i >= 0 else ""
+                smushed = smush_chars(left=left, right=text[len(text) - 1 - i])
+                if start + i >= 0:
+                    glyph[start + i] = smushed
+            text = text[: max(len(text) - smush, 0)] + "".join(glyph)[::-1]
+        else:
+            start = len(text) - smush
+            chars = list(text)
+            for i in range(smush):
+                smushed = smush_chars(left=text[start + i] if start + i >= 0 else "", right=glyph_row[i])
+                if start + i >= 0:
+                    chars[start + i] = smushed
+            text = "".join(chars) + glyph_row[smush:]
+
+        stripped = text.rstrip(" ")
+        self.buffer[row] = _Row(
+            len(text), len(stripped) - 1, stripped[-1:], *_spans(text, self.font.hardBlank), text
+        )
+
+
+def natural_width(text: str, font: FigletFont, direction: str = "left-to-right") -> int:
+    """Return the width that a text needs so that it renders without wrapping. The render
+    does not wrap when the width of the Figlet is greater than this.
+
+    This is computed from the glyph widths and the smushing rules of the font, without
+    building the render. It takes O(len(text)) time.
+
+    Args:
+        text: The text to measure.
+        font: The font (a Pyfiglet FigletFont or a GlyphTable from the font registry).
+        direction: 'left-to-right' or 'right-to-left'."""
+
+    builder = MeasuringBuilder(text, font, direction, sys.maxsize, "left")
+    builder.run()
+    widest_row = max((row.length for block in builder.blocks() for row in block), default=0)
+    return max(widest_row, builder.widest_char - 1)
+
+
+def measure_figlet(figlet: CustomFiglet, text: str, trim: bool = True) -> Measurement:
+    """Return the size of the lines that `render_cached(figlet, text, trim)` returns (which
+    are the lines the FigletWidget displays), without rendering.
+
+    The size is computed from the glyph widths and the smushing rules of the font, with
+    Pyfiglet's own wrapping logic, in O(len(text)) time. For fonts whose glyphs contain
+    line breaks, it falls back to a real render.
+
+    Args:
+        figlet: The CustomFiglet to take the font, width, justify and direction settings from.
+        text: The text to measure.
+        trim: Whether the empty space on the left and right sides is cut off.
+    Raises:
+        CharNotPrinted: If the width is too small for a character. (When the width is exactly
+            as wide as a character, Pyfiglet never finishes rendering. This raises instead.)"""
+
+    if text == "":
+        return Measurement(0, 1)
+
+    font = figlet.Font
+    try:
+        if _font_profile(font)[1]:
+            raise ValueError("The glyphs contain line breaks.")
+        builder = MeasuringBuilder(text, font, figlet.direction, figlet.width, figlet.justify)
+        builder.run()
+    except CharNotPrinted:
+        raise
+    except Exception:  # Whatever Pyfiglet does in this case, the real render does it too.
+        lines = trim_render(str(figlet.renderText(text)).splitlines(), trim)
+        return Measurement(max(len(line) for line in lines), len(lines))
+
+    rows = builder.lines()
+    visible = [i for i, (_, solid, _) in enumerate(rows) if solid is not None]
+    if not visible:  # Same as trim_render: a blank render is a single empty line.
+        return Measurement(0, 1)
+    rows = rows[visible[0] : visible[-1] + 1]
+
+    if not trim:
+        return Measurement(max(length for length, _, _ in rows), len(rows))
+
+    figstart = min(solid[0] for _, solid, _ in rows if solid is not None)
+    width = max((ink[1] + 1 - figstart for _, _, ink in rows if ink is not None), default=0)
+    return Measurement(max(width, 0), len(rows))
+
+
+def measure(
+    text: str,
+    font: ALL_FONTS = "standard",
+    width: int | None = None,
+    justify: JUSTIFY_OPTIONS = "left",
+    trim: bool = True,
+) -> Measurement:
+    """Return the size of a render, without rendering it. The size is the width and height
+    of the lines that `render_lines` returns with the same arguments.
+
+    Args:
+        text: The text to measure.
+        font: The font to use. Default is 'standard'.
+        width: The maximum width of the render, in characters. If None (the default), the
+            text is not wrapped: it is measured at the smallest width at which it does not wrap.
+        justify: Justification for the text. Default is 'left'.
+        trim: Whether the empty space on the left and right sides is cut off.
+    Raises:
+        CharNotPrinted: If the width is too small for a character."""
+
+    figlet = CustomFiglet(font=font, justify=justify)
+    figlet.width = natural_width(text, figlet.Font, figlet.direction) + 1 if width is None else width
+    return measure_figlet(figlet, text, trim)
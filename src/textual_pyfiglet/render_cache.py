@@ -0,0 +1,182 @@
+"""Module for the RenderCache class.
+
+The render cache is process-wide. It is shared by every FigletWidget so that
+rendering the same text with the same settings twice (for instance when a resize
+event re-sets `text_input`, or when toggling back and forth between two fonts)
+only costs a dictionary lookup."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import sys
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Tuple
+
+RenderKey = Tuple[str, str, int, str, str, bool]
+"(text, font, width, justify, direction, trimmed)"
+
+
+class RenderResult(NamedTuple):
+    """A single cached render."""
+
+    raw: str
+    "The raw string returned by Pyfiglet."
+    lines: tuple[str, ...]
+    "The rendered lines after the blank lines were stripped (and the sides trimmed, if trimmed)."
+
+
+class CacheInfo(NamedTuple):
+    """Statistics about a RenderCache. Returned by `RenderCache.info()`."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    max_bytes: int | None
+    currsize: int
+    currbytes: int
+
+
+class RenderCache:
+    """A thread-safe LRU cache of rendered figlets.
+
+    Entries are evicted in least-recently-used order whenever the cache holds more than
+    `maxsize` entries, or when the estimated size of all entries goes over `max_bytes`.
+    Either limit can be set to None to disable it."""
+
+    def __init__(self, maxsize: int | None = 256, max_bytes: int | None = None) -> None:
+        """Create a RenderCache.
+
+        Args:
+            maxsize: Maximum number of renders to keep. None for no limit.
+            max_bytes: Maximum estimated memory size of all renders, in bytes. None for no limit.
+        """
+        self._validate_limits(maxsize, max_bytes)
+
+        self._maxsize = maxsize
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[RenderKey, tuple[RenderResult, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups that found a render in the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that did not find a render in the cache."""
+        return self._misses
+
+    def get(self, key: RenderKey) -> RenderResult | None:
+        """Look up a render. Returns None (and counts a miss) if it is not cached.
+
+        Args:
+            key: The render key. See `RenderKey`."""
+
+        with self._lock:
+            try:
+                result, _ = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+
+    def put(self, key: RenderKey, result: RenderResult) -> None:
+        """Store a render in the cache, evicting old renders if a limit is exceeded.
+
+        Args:
+            key: The render key. See `RenderKey`.
+            result: The render to store."""
+
+        size = self._estimate_size(key, result)
+        with self._lock:
+            if key in self._entries:
+                _, old_size = self._entries.pop(key)
+                self._bytes -= old_size
+            if self._max_bytes is not None and size > self._max_bytes:
+                return  # Would evict everything else and still not fit.
+            self._entries[key] = (result, size)
+            self._bytes += size
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all renders from the cache and reset the hit/miss counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def resize(self, maxsize: int | None = 256, max_bytes: int | None = None) -> None:
+        """Change the limits of the cache. Renders are evicted immediately if the
+        cache is now over one of the new limits.
+
+        Args:
+            maxsize: Maximum number of renders to keep. None for no limit.
+            max_bytes: Maximum estimated memory size of all renders, in bytes. None for no limit.
+        """
+
+        self._validate_limits(maxsize, max_bytes)
+        with self._lock:
+            self._maxsize = maxsize
+            self._max_bytes = max_bytes
+            self._evict()
+
+    def info(self) -> CacheInfo:
+        """Return the hit/miss counters and current size of the cache."""
+
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self._maxsize,
+                max_bytes=self._max_bytes,
+                currsize=len(self._entries),
+                currbytes=self._bytes,
+            )
+
+    # Must be called while holding the lock.
+    def _evict(self) -> None:
+
+        while self._entries and (
+            (self._maxsize is not None and len(self._entries) > self._maxsize)
+            or (self._max_bytes is not None and self._bytes > self._max_bytes)
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+
+    @staticmethod
+    def _estimate_size(key: RenderKey, result: RenderResult) -> int:
+
+        size = sys.getsizeof(key[0]) + sys.getsizeof(result.raw)
+        for line in result.lines:
+            size += sys.getsizeof(line)
+        return size
+
+    @staticmethod
+    def _validate_limits(maxsize: int | None, max_bytes: int | None) -> None:
+
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be None or a positive integer.")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes must be None or a positive integer.")
+
+
+render_cache = RenderCache()
+"The process-wide render cache shared by all FigletWidgets."
@@ -0,0 +1,391 @@
+"""Module for the rendering functions that do not depend on Textual.
+
+Everything in here only needs Pyfiglet. This is what `FigletWidget` uses internally,
+and it can also be used on its own (for instance to print a banner from a CLI tool)
+without paying for importing Textual:
+
+```
+from textual_pyfiglet import figlet_quick
+
+print(figlet_quick("My Banner", font="slant"))
+```
+"""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional
+from typing_extensions import Literal
+
+# Other library imports
+from pyfiglet import Figlet, FigletBuilder, FigletFont
+
+# Local imports:
+from textual_pyfiglet.font_registry import font_registry
+from textual_pyfiglet.render_cache import RenderCache, RenderKey, RenderResult, render_cache
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
+    from textual_pyfiglet.disk_cache import DiskRenderCache
+    from textual_pyfiglet.fonts_list import ALL_FONTS
+
+# CONSTANTS:
+JUSTIFY_OPTIONS = Literal["left", "center", "right"]
+
+
+class CustomFiglet(Figlet):
+
+    def setFont(self, **kwargs: str) -> None:
+        """Overrides Pyfiglet's setFont to get the font from the shared font registry
+        instead of reading and parsing the font file again."""
+
+        if "font" in kwargs:
+            self.font = kwargs["font"]
+
+        self.Font = font_registry.get(self.font)
+
+    @property
+    def direction(self) -> str:
+        return self.direction_for(self.Font)
+
+    @direction.setter
+    def direction(self, value: str) -> None:
+        self._direction = value
+
+    @property
+    def justify(self) -> str:
+        if self._justify == "auto":
+            if self.direction == "left-to-right":
+                return "left"
+            else:
+                assert self.direction == "right-to-left"
+                return "right"
+        else:
+            return self._justify
+
+    @justify.setter
+    def justify(self, value: str) -> None:
+        self._justify = value
+
+    def direction_for(self, font: FigletFont) -> str:
+        """Return the direction this figlet would render in with a font. When the
+        direction setting is 'auto', it comes from the font."""
+
+        if self._direction == "auto":
+            direction = font.printDirection
+            if direction == 0:
+                return "left-to-right"
+            elif direction == 1:
+                return "right-to-left"
+            else:
+                return "left-to-right"
+        else:
+            return self._direction
+
+    def copy(self) -> CustomFiglet:
+        """Return a new CustomFiglet with the same settings. The font is shared, not loaded again.
+        This can be used to render in another thread while the original keeps changing."""
+
+        return CustomFiglet(
+            font=self.font, direction=self._direction, justify=self._justify, width=self.width
+        )
+
+
+class ResumableBuilder(FigletBuilder):
+    """A Pyfiglet FigletBuilder that can be given more text after it has finished.
+
+    The state of a FigletBuilder after it has processed the first N characters only
+    depends on those N characters (when it wraps, it only ever rewinds to an earlier
+    blank). So rendering `text + suffix` can continue from where rendering `text` stopped,
+    instead of starting over. Unlike `returnProduct`, `product_string` does not modify
+    the builder, so it can be called after every extension."""
+
+    def extend(self, suffix: str) -> None:
+        """Add more text to the end of the text being rendered."""
+
+        self.text.extend(map(ord, suffix))
+
+    def run(self) -> None:
+        """Process all the characters that have not been processed yet."""
+
+        while self.iterator < len(self.text):
+            self.addCharToProduct()  # type: ignore[no-untyped-call]
+            self.iterator += 1
+
+    def product_string(self) -> str:
+        """Return the render of all the text processed so far, exactly as
+        `returnProduct` would, but without modifying the builder."""
+
+        queue = [list(buffer) for buffer in self.product.queue]  # justifyString works in place.
+        if self.buffer[0] != "":
+            queue.append(list(self.buffer))
+
+        string_acc = ""
+        for buffer in queue:
+            buffer = self.justifyString(self.justify, buffer)
+            string_acc += self.replaceHardblanks(buffer)
+        return string_acc
+
+    #! OVERRIDE
+    def getCharAt(self, i: int) -> Optional[list[str]]:
+        # Same as Pyfiglet's version, without copying the whole text to a new list on every call.
+        if i < 0 or i >= len(self.text):
+            return None
+        return self.font.chars.get(self.text[i])
+
+
+class IncrementalRenderer:
+    """Renders text by re-using as much of the previous render as possible.
+
+    Pyfiglet starts from a blank buffer after every newline, so the text is split into
+    logical lines, and each line is rendered into its own block. The blocks of the
+    previous render are kept, and only the lines whose text changed are rendered again.
+    The output is the blocks joined together, which is identical to a full render.
+
+    This is made for live typing. A line that is being typed at the end also does not
+    start over on every keystroke: when its new text is its previous text plus some
+    characters, the builder of the previous render continues from where it stopped, and
+    only the new characters are processed (smushed onto the right edge of the line).
+    Wrapping is handled the same way Pyfiglet handles it, so this is always exact.
+    Changing the font, width, justify or direction clears the blocks."""
+
+    def __init__(self) -> None:
+
+        self._settings: tuple[FigletFont, str, int, str] | None = None
+        self._blocks: dict[str, str] = {}
+        self._builder: ResumableBuilder | None = None
+        self._builder_text = ""
+
+    def render(self, figlet: CustomFiglet, text: str) -> str:
+        """Render text with the settings of a Figlet. Returns the same string as
+        `figlet.renderText(text)`.
+
+        Args:
+            figlet: The CustomFiglet to take the font, width, justify and direction settings from.
+            text: The text to render.
+        Raises:
+            FigletError: If Pyfiglet fails to render the text."""
+
+        settings = (figlet.Font, figlet.direction, figlet.width, figlet.justify)
+        if settings != self._settings:
+            self._blocks = {}
+            self._settings = settings
+
+        # Every line but the last keeps its newline. It makes Pyfiglet output a block of
+        # blank rows for an empty line, the same as it does in a full render.
+        lines = [line + "\n" for line in text.split("\n")]
+        lines[-1] = lines[-1][:-1]
+
+        blocks: dict[str, str] = {}
+        for line in lines:
+            if line not in blocks:
+                block = self._blocks.get(line)
+                blocks[line] = block if block is not None else self._render_line(figlet, line)
+        self._blocks = blocks  # Only keep the lines of the current text.
+
+        return "".join([blocks[line] for line in lines])
+
+    def reset(self) -> None:
+        """Forget the previous render. The next render will be a full render."""
+
+        self._settings = None
+        self._blocks = {}
+        self._builder = None
+        self._builder_text = ""
+
+    def _render_line(self, figlet: CustomFiglet, line: str) -> str:
+
+        builder = self._builder
+        if (
+            builder is not None
+            and line.startswith(self._builder_text)
+            and (builder.font, builder.direction, builder.width)
+            == (figlet.Font, figlet.direction, figlet.width)
+        ):
+            builder.extend(line[len(self._builder_text) :])
+        else:
+            builder = ResumableBuilder(line, figlet.Font, figlet.direction, figlet.width, figlet.justify)
+
+        self._builder = None  # If the builder raises, its state is not usable anymore.
+        builder.run()
+        self._builder, self._builder_text = builder, line
+
+        builder.justify = figlet.justify
+        return builder.product_string()
+
+
+def figlet_quick(
+    text: str, font: ALL_FONTS = "standard", width: int = 80, justify: JUSTIFY_OPTIONS = "left"
+) -> str:
+    """Render a figlet and return it as a string, the same as the figlet_format function
+    in the pyfiglet package, except it uses the shared font registry so the font is not
+    loaded again on every call. It also adds type hinting / auto-completion for the fonts list.
+
+    Args:
+        text: The text to render.
+        font: The font to use. Default is 'standard'.
+        width: The maximum width of the render, in characters.
+        justify: Justification for the text. Default is 'left'."""
+
+    figlet = CustomFiglet(font=font, width=width, justify=justify)
+    return str(figlet.renderText(text))
+
+
+def render_lines(
+    text: str,
+    font: ALL_FONTS = "standard",
+    width: int = 80,
+    justify: JUSTIFY_OPTIONS = "left",
+    trim: bool = True,
+) -> list[str]:
+    """Render a figlet and return it as a list of lines, exactly like the FigletWidget
+    would display it. Blank lines at the top and bottom are stripped. The result is
+    stored in (and served from) the shared render cache.
+
+    Args:
+        text: The text to render.
+        font: The font to use. Default is 'standard'.
+        width: The maximum width of the render, in characters.
+        justify: Justification for the text. Default is 'left'.
+        trim: Whether to also cut off the empty space on the left and right sides.
+            The FigletWidget does this when its width is 'auto'."""
+
+    if text == "":
+        return [""]
+    figlet = CustomFiglet(font=font, width=width, justify=justify)
+    return list(render_cached(figlet, text, trim).lines)
+
+
+_in_flight: dict[tuple[object, ...], asyncio.Future[list[str]]] = {}
+"The renders that render_lines_async is currently waiting for, by event loop and arguments."
+
+
+async def render_lines_async(
+    text: str,
+    font: ALL_FONTS = "standard",
+    width: int = 80,
+    justify: JUSTIFY_OPTIONS = "left",
+    trim: bool = True,
+    executor: Executor | None = None,
+) -> list[str]:
+    """The async version of `render_lines`. The render runs in an executor, so it does
+    not block the event loop. It uses the same font registry and render cache.
+
+    If the same render is requested again while the first one is still running, the second
+    request does not start another render, it waits for the first one. Cancelling one of
+    the requests does not cancel the render for the others.
+
+    Args:
+        text: The text to render.
+        font: The font to use. Default is 'standard'.
+        width: The maximum width of the render, in characters.
+        justify: Justification for the text. Default is 'left'.
+        trim: Whether to also cut off the empty space on the left and right sides.
+        executor: The executor to render in. Default is the event loop's default executor."""
+
+    import asyncio
+    from functools import partial
+
+    loop = asyncio.get_running_loop()
+    key = (loop, text, font, width, justify, trim)
+    future = _in_flight.get(key)
+    if future is None:
+        future = loop.run_in_executor(executor, partial(render_lines, text, font, width, justify, trim))
+        _in_flight[key] = future
+        future.add_done_callback(partial(_render_done, key))
+
+    return list(await asyncio.shield(future))  # Every caller gets its own list.
+
+
+def _render_done(key: tuple[object, ...], future: asyncio.Future[list[str]]) -> None:
+
+    del _in_flight[key]
+    if not future.cancelled():
+        future.exception()  # Marks the exception as retrieved, in case every caller was cancelled.
+
+
+def render_key(figlet: CustomFiglet, text: str, trim: bool) -> RenderKey:
+    """Return the render cache key for rendering `text` with a figlet's current settings."""
+
+    return (text, figlet.font, figlet.width, figlet.justify, figlet.direction, trim)
+
+
+def render_cached(
+    figlet: CustomFiglet,
+    text: str,
+    trim: bool,
+    cache: RenderCache = render_cache,
+    incremental: IncrementalRenderer | None = None,
+    disk_cache: DiskRenderCache | None = None,
+) -> RenderResult:
+    """Render text with a CustomFiglet, going through the render cache.
+
+    Args:
+        figlet: The CustomFiglet to render with. Its font, width and justify settings are used.
+        text: The text to render.
+        trim: Whether to cut off the empty space on the left and right sides.
+        cache: The render cache to use. Defaults to the process-wide render cache.
+        incremental: If given, renders that are not in the cache are done with this
+            IncrementalRenderer, so they can continue from its previous render.
+        disk_cache: If given, renders that are not in the render cache are looked up in
+            this DiskRenderCache before rendering, and new renders are stored in it.
+    Raises:
+        FigletError: If Pyfiglet fails to render the text."""
+
+    key = render_key(figlet, text, trim)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    raw = disk_cache.get(key) if disk_cache is not None else None
+    if raw is None:
+        if incremental is not None:
+            raw = incremental.render(figlet, text)  # * <- Actual render happens here.
+        else:
+            raw = str(figlet.renderText(text))  # * <- Or here.
+        if disk_cache is not None:
+            disk_cache.put(key, raw)
+    result = RenderResult(raw, tuple(trim_render(raw.splitlines(), trim)))
+    cache.put(key, result)
+    return result
+
+
+def trim_render(render_lines: list[str], trim: bool) -> list[str]:
+    """Strip the blank lines from the top and bottom of a render. If `trim` is True,
+    the empty space on the left and right sides is also cut off.
+
+    Every line is only scanned once, and the scanning is done by the string methods
+    (strip, lstrip, startswith), so it does not loop over characters in Python."""
+
+    # A line is blank if it only contains spaces.
+    start, end = 0, len(render_lines)
+    while start < end and not render_lines[start].strip(" "):
+        start += 1
+    while end > start and not render_lines[end - 1].strip(" "):
+        end -= 1
+
+    if start == end:  # if the figlet output is blank, return empty list
+        return [""]
+
+    lines_cleaned = render_lines[start:end]
+    if not trim:
+        return lines_cleaned
+
+    # The start of the figlet is the lowest indentation of all the lines that are not blank.
+    # A line that starts with as many spaces as the lowest indentation found so far
+    # cannot lower it, and checking that with startswith is much cheaper than lstrip.
+    figstart = -1
+    indent = ""
+    for line in lines_cleaned:
+        if figstart >= 0 and line.startswith(indent):
+            continue
+        stripped = line.lstrip(" ")
+        if stripped:
+            figstart = len(line) - len(stripped)
+            indent = " " * figstart
+
+    return [line[figstart:].rstrip() for line in lines_cleaned]  # cuts before and after
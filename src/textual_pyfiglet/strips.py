@@ -0,0 +1,265 @@
+"""Module for building the styled strips that a FigletWidget displays.
+
+The Coloromatic base class colors every line again each time Textual asks for it, and
+animates by rotating its list of colors. The functions here build the same strips ahead
+of time, so the FigletWidget can keep them and answer line requests with a lookup. They
+look the same as the output of `Coloromatic.render_line` (without `repeat`), with fewer
+segments: a figlet is mostly spaces, and a space looks the same whatever its foreground
+color, so runs of spaces do not start a segment of their own color (unless the style has
+a background or a text style that shows on spaces, or the widget's CSS `text-style` does).
+They join the segment next to them, and neighboring segments with the same style are merged.
+Every segment costs escape sequences when it is sent to the terminal, so this is what
+decides how many bytes an animation frame takes (see `frame_bytes`).
+
+An animation is periodic: after as many frames as there are colors, the colors are back
+where they started. The FrameCycle keeps every frame of that cycle, so an animation only
+styles each frame once, and playing it is a lookup by frame index."""
+
+# ~ Type Checking (Pyright and MyPy) - Strict Mode
+# ~ Linting - Ruff
+# ~ Formatting - Black - max 110 characters / line
+
+# STANDARD LIBRARY IMPORTS
+from __future__ import annotations
+import io
+import re
+from functools import lru_cache
+from typing import Iterable, Sequence
+
+# Textual and Rich imports
+from textual.strip import Strip
+from rich.console import Console
+from rich.segment import Segment
+from rich.style import Style
+
+DEFAULT_MAX_SEGMENTS = 200_000
+"Frames are only kept if the whole cycle has at most this many segments."
+
+
+_RUNS = re.compile(r" +|[^ ]+")
+_PLAIN = Style()
+
+
+def text_style_shows_spaces(style: Style) -> bool:
+    """Return True if the text style of a style (reverse, underline, strike or overline)
+    draws the foreground color on spaces."""
+
+    return bool(style.reverse or style.underline or style.underline2 or style.strike or style.overline)
+
+
+@lru_cache(maxsize=1024)
+def _shows_on_spaces(style: Style) -> bool:
+    """Return True if a space does not look the same in this style as in no style."""
+
+    return style.bgcolor is not None or text_style_shows_spaces(style)
+
+
+def compact_segments(pieces: Iterable[tuple[str, Style]], keep_spaces: bool = False) -> list[Segment]:
+    """Turn (text, style) pieces into as few segments as possible. Runs of spaces do not
+    need a color of their own (unless their style shows on spaces), so they join the segment
+    before them (or after them, at the start of the line) instead of starting a new one, and
+    neighbors with the same style are merged.
+
+    Args:
+        pieces: The text and style of each piece of the line, in order.
+        keep_spaces: Whether spaces keep their own style, because a style that is added to
+            the whole line later (the widget's CSS `text-style`) shows on spaces."""
+
+    texts: list[str] = []
+    styles: list[Style] = []
+    leading = ""  # Spaces before the first segment.
+    for text, style in pieces:
+        runs: list[tuple[str, Style | None]]
+        if keep_spaces or _shows_on_spaces(style):
+            runs = [(text, style)]
+        elif len(text) == 1:
+            runs = [(text, None if text == " " else style)]
+        else:
+            runs = [(run, None if run[0] == " " else style) for run in _RUNS.findall(text)]
+
+        for run, run_style in runs:
+            if run_style is None:  # Spaces, which look the same in any style.
+                if texts:
+                    texts[-1] += run
+                else:
+                    leading += run
+            elif styles and (styles[-1] is run_style or styles[-1] == run_style):
+                texts[-1] += run
+            else:
+                texts.append(leading + run)
+                styles.append(run_style)
+                leading = ""
+
+    if leading:  # The line is only spaces.
+        texts.append(leading)
+        styles.append(_PLAIN)
+    return [Segment(text, style) for text, style in zip(texts, styles)]
+
+
+def style_line(
+    line: str,
+    y: int,
+    colors: Sequence[Style],
+    animation_type: str,
+    horizontal: bool,
+    keep_spaces: bool = False,
+) -> Strip:
+    """Color a line of the render.
+
+    Args:
+        line: The text of the line. It must not be empty.
+        y: The index of the line in the render.
+        colors: The styles of the current frame (the Coloromatic's `_line_colors`).
+        animation_type: The animation type of the widget.
+        horizontal: Whether the gradient is horizontal.
+        keep_spaces: Whether spaces keep their own style (see `compact_segments`)."""
+
+    if animation_type == "gradient":
+        if not horizontal:
+            return Strip(compact_segments([(line, colors[y % len(colors)])], keep_spaces))
+        count = len(colors)
+        return Strip(
+            compact_segments([(char, colors[i % count]) for i, char in enumerate(line)], keep_spaces)
+        )
+    # Strobes color the whole figlet with one color.
+    return Strip(compact_segments([(line, colors[0])], keep_spaces))
+
+
+def style_lines(
+    lines: Sequence[str],
+    colors: Sequence[Style],
+    animation_type: str,
+    horizontal: bool,
+    width: int,
+    keep_spaces: bool = False,
+) -> list[Strip]:
+    """Color every line of the render.
+
+    Args:
+        lines: The lines of the render.
+        colors: The styles of the current frame (the Coloromatic's `_line_colors`).
+        animation_type: The animation type of the widget.
+        horizontal: Whether the gradient is horizontal.
+        width: The width of the widget. Empty lines are blank strips of this width.
+        keep_spaces: Whether spaces keep their own style (see `compact_segments`)."""
+
+    blank = Strip.blank(width)
+    return [
+        style_line(line, y, colors, animation_type, horizontal, keep_spaces) if line else blank
+        for y, line in enumerate(lines)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _measuring_console() -> Console:
+    return Console(file=io.StringIO(), color_system="truecolor", force_terminal=True, legacy_windows=False)
+
+
+def frame_bytes(strips: Iterable[Strip]) -> int:
+    """Return how many bytes the strips take when they are sent to a truecolor terminal
+    (UTF-8 text and escape sequences), before Textual adds the styles of the widget.
+
+    Args:
+        strips: The strips of a frame."""
+
+    console = _measuring_console()
+    return sum(len(strip.render(console).encode("utf-8")) for strip in strips)
+
+
+def rotate(colors: list[Style], phase: int) -> list[Style]:
+    """Return the colors as they are after `deque.rotate(phase)`."""
+
+    split = len(colors) - phase % len(colors)
+    return colors[split:] + colors[:split]
+
+
+class FrameCycle:
+    """The styled frames of one animation cycle. Frame `phase` is the render styled with the
+    colors rotated `phase` times. Each frame is styled the first time it is asked for, and
+    kept, unless the whole cycle would be bigger than `max_segments` (a wide horizontal
+    gradient, for instance). Then only the last frame is kept."""
+
+    def __init__(
+        self,
+        lines: Sequence[str],
+        colors: Sequence[Style],
+        animation_type: str,
+        horizontal: bool,
+        width: int,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+        keep_spaces: bool = False,
+    ) -> None:
+        """Create a FrameCycle. The lines and colors are copied.
+
+        Args:
+            lines: The lines of the render.
+            colors: The styles of the first frame (the Coloromatic's `_line_colors`).
+            animation_type: The animation type of the widget.
+            horizontal: Whether the gradient is horizontal.
+            width: The width of the widget. Empty lines are blank strips of this width.
+            max_segments: The maximum number of segments kept for the whole cycle.
+            keep_spaces: Whether spaces keep their own style (see `compact_segments`)."""
+
+        self.lines = list(lines)
+        self.colors = list(colors)
+        self.animation_type = animation_type
+        self.horizontal = horizontal
+        self.width = width
+        self.keep_spaces = keep_spaces
+
+        if animation_type == "gradient" and horizontal:
+            segments = sum(len(line) for line in self.lines)
+        else:
+            segments = len(self.lines)
+        self.keep_all = segments * len(self.colors) <= max_segments
+        self._frames: dict[int, list[Strip]] = {}
+        self._changes: dict[tuple[int, int], list[tuple[int, int]]] = {}
+
+    def __len__(self) -> int:
+        """The number of frames in the cycle."""
+        return len(self.colors)
+
+    def frame(self, phase: int) -> list[Strip]:
+        """Return the strips of a frame.
+
+        Args:
+            phase: How many times the colors were rotated (negative when reversed)."""
+
+        phase %= len(self.colors)
+        strips = self._frames.get(phase)
+        if strips is None:
+            strips = style_lines(
+                self.lines,
+                rotate(self.colors, phase),
+                self.animation_type,
+                self.horizontal,
+                self.width,
+                self.keep_spaces,
+            )
+            if not self.keep_all:
+                self._frames.clear()
+            self._frames[phase] = strips
+        return strips
+
+    def changed_spans(self, before: int, after: int) -> list[tuple[int, int]]:
+        """Return the lines that look different in frame `after` than in frame `before`, as
+        (first line, number of lines) spans. Lines that keep their style between two frames
+        (blank lines, or lines that are only spaces) do not need to be repainted.
+
+        Args:
+            before: The phase of the frame on screen.
+            after: The phase of the next frame."""
+
+        key = (before % len(self.colors), after % len(self.colors))
+        if key not in self._changes:
+            old, new = self.frame(key[0]), self.frame(key[1])
+            spans: list[tuple[int, int]] = []
+            for y, (old_strip, new_strip) in enumerate(zip(old, new)):
+                if old_strip is new_strip or old_strip == new_strip:
+                    continue
+                if spans and spans[-1][0] + spans[-1][1] == y:
+                    spans[-1] = (spans[-1][0], spans[-1][1] + 1)
+                else:
+                    spans.append((y, 1))
+            self._changes[key] = spans
+        return self._changes[key]
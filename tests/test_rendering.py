@@ -0,0 +1,900 @@
+import asyncio
+from collections import deque
+import gc
+import json
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+from typing import Any
+import weakref
+
+import pytest
+from pyfiglet import Figlet, figlet_format
+from rich.segment import Segment
+
+from rich.style import Style
+from textual.app import App, ComposeResult
+from textual.containers import ScrollableContainer
+from textual.geometry import Region
+from textual.screen import ModalScreen, Screen
+from textual.strip import Strip
+from textual.widgets import Static
+from textual_coloromatic import Coloromatic
+
+from textual_pyfiglet import FigletWidget, render_lines
+from textual_pyfiglet.font_index import FontIndex, FontIndexError, FontInfo, build_index
+from textual_pyfiglet.font_pack import FontPack, FontPackError, build_pack
+from textual_pyfiglet.font_registry import FontRegistry, GlyphTable, font_registry
+from textual_pyfiglet.measure import measure, natural_width
+from textual_pyfiglet.render_cache import RenderCache, RenderResult
+from textual_pyfiglet import renderer, strips
+from textual_pyfiglet._atomic import atomic_write
+from textual_pyfiglet.animation_clock import AnimationClock
+from textual_pyfiglet.benchmarks import cli as bench_cli
+from textual_pyfiglet.batch import render_many
+from textual_pyfiglet.disk_cache import DiskRenderCache
+from textual_pyfiglet.renderer import CustomFiglet, IncrementalRenderer, trim_render
+
+
+def make_result(text: str) -> RenderResult:
+    return RenderResult(text, (text,))
+
+
+def record_calls(monkeypatch: pytest.MonkeyPatch, owner: object, name: str, arg: int = 0) -> "list[Any]":
+    """Wrap `owner.name` so every call appends its argument number `arg` to the returned list."""
+    calls: list[Any] = []
+    original = getattr(owner, name)
+
+    def recording(*args: Any, **kwargs: Any) -> Any:
+        calls.append(args[arg])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(owner, name, recording)
+    return calls
+
+
+@pytest.fixture
+def rendered(monkeypatch: pytest.MonkeyPatch) -> "list[str]":
+    """The text of every `FigletWidget.render_figlet` call during the test."""
+    return record_calls(monkeypatch, FigletWidget, "render_figlet", arg=1)
+
+
+@pytest.fixture
+def styled(monkeypatch: pytest.MonkeyPatch) -> "list[object]":
+    """The lines of every `strips.style_lines` call during the test."""
+    return record_calls(monkeypatch, strips, "style_lines")
+
+
+def cells(strip: Strip) -> "list[tuple[str, Style | None]]":
+    """What a strip looks like: every character with its style. Spaces have no color."""
+    return [(char, None if char == " " else segment.style) for segment in strip for char in segment.text]
+
+
+def test_render_cache_lru_eviction():
+    """The least recently used render is evicted first."""
+    cache = RenderCache(maxsize=2)
+    cache.put(("a", "standard", 80, "left", "left-to-right", True), make_result("a"))
+    cache.put(("b", "standard", 80, "left", "left-to-right", True), make_result("b"))
+    assert cache.get(("a", "standard", 80, "left", "left-to-right", True)) is not None
+    cache.put(("c", "standard", 80, "left", "left-to-right", True), make_result("c"))
+
+    assert ("a", "standard", 80, "left", "left-to-right", True) in cache
+    assert ("b", "standard", 80, "left", "left-to-right", True) not in cache
+    assert len(cache) == 2
+
+
+def test_render_cache_counters_and_clear():
+    cache = RenderCache(maxsize=None, max_bytes=1_000_000)
+    key = ("text", "slant", 40, "center", "left-to-right", False)
+    assert cache.get(key) is None
+    cache.put(key, make_result("text"))
+    assert cache.get(key) == make_result("text")
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    assert info.currbytes > 0
+
+    cache.clear()
+    assert cache.info() == (0, 0, None, 1_000_000, 0, 0)
+
+
+def test_render_cache_byte_limit():
+    cache = RenderCache(maxsize=None, max_bytes=400)
+    for i in range(10):
+        cache.put((f"text {i}", "standard", 80, "left", "left-to-right", True), make_result("x" * 50))
+    assert 0 < cache.info().currbytes <= 400
+    assert ("text 9", "standard", 80, "left", "left-to-right", True) in cache
+
+
+def test_widgets_share_render_cache():
+    """A second widget with the same text and settings is served from the cache."""
+    FigletWidget.render_cache.clear()
+    first = FigletWidget("Cached", font="slant")
+    second = FigletWidget("Cached", font="slant")
+
+    assert first._animation_lines == second._animation_lines
+    assert first.get_figlet_as_string() == second.get_figlet_as_string()
+    assert FigletWidget.render_cache.info().hits == 1
+
+
+def test_font_registry_parses_once():
+    registry = FontRegistry()
+    table = registry.get("slant")
+
+    assert registry.get("slant") is table
+    assert registry.resident_fonts() == ["slant"]
+    with pytest.raises(AttributeError):
+        table.height = 3
+    with pytest.raises(TypeError):
+        table.chars[ord("A")] = ("A",)  # type: ignore[index]
+
+
+def test_widgets_share_fonts():
+    first = FigletWidget("One", font="small")
+    second = FigletWidget("Two", font="small")
+
+    assert isinstance(first.figlet.Font, GlyphTable)
+    assert first.figlet.Font is second.figlet.Font
+    assert "small" in FigletWidget.font_registry.resident_fonts()
+
+
+@pytest.mark.parametrize("font", ["standard", "slant", "banner3-D", "mirror", "smblock"])
+def test_figlet_quick_matches_pyfiglet(font: str):
+    text = "Hello, World 42!"
+    for justify in ("left", "center", "right"):
+        expected = figlet_format(text, font=font, width=60, justify=justify)
+        assert FigletWidget.figlet_quick(text, font=font, width=60, justify=justify) == expected
+
+
+def test_font_pack_round_trip(tmp_path):
+    fonts = ["standard", "slant", "mirror", "banner3-D"]
+    pack_path = tmp_path / "fonts.pack"
+    assert build_pack(pack_path, fonts=fonts) == len(fonts)
+
+    with FontPack(pack_path) as pack:
+        assert pack.names() == fonts
+        for font in fonts:
+            packed, parsed = pack.load(font), GlyphTable.load(font)
+            assert packed.chars == parsed.chars
+            assert packed.width == parsed.width
+            assert (packed.height, packed.baseline, packed.hardBlank) == (
+                parsed.height,
+                parsed.baseline,
+                parsed.hardBlank,
+            )
+            assert (packed.printDirection, packed.smushMode) == (parsed.printDirection, parsed.smushMode)
+
+
+def test_font_pack_rejects_other_files(tmp_path):
+    not_a_pack = tmp_path / "fonts.pack"
+    not_a_pack.write_bytes(b"flf2a$ 6 5 16 15 11 0 24463")
+    with pytest.raises(FontPackError):
+        FontPack(not_a_pack)
+
+
+def test_wheel_contains_generated_font_data(tmp_path):
+    """A wheel built from a clean checkout (without the generated files) contains them."""
+    builders = pytest.importorskip("hatchling.builders.wheel")
+    root = Path(__file__).parent.parent
+    tree = tmp_path / "tree"
+    shutil.copytree(root / "src", tree / "src", ignore=shutil.ignore_patterns("fonts.pack", "fonts.index"))
+    for name in ("pyproject.toml", "hatch_build.py", "README.md", "LICENSE", ".gitignore"):
+        shutil.copy(root / name, tree / name)
+
+    wheel = next(iter(builders.WheelBuilder(str(tree)).build(directory=str(tmp_path), versions=["standard"])))
+    shutil.unpack_archive(wheel, tmp_path / "installed", format="zip")
+    check = (
+        "import sys; from textual_pyfiglet import font_index, font_pack;"
+        "assert font_pack.__file__.startswith(sys.argv[1]);"
+        "assert font_pack.FontPack.open_default() is not None;"
+        "assert font_index.FontIndex.open_default() is not None"
+    )
+    installed = str(tmp_path / "installed")
+    subprocess.run(
+        [sys.executable, "-c", check, installed], check=True, env={**os.environ, "PYTHONPATH": installed}
+    )
+
+
+def test_import_does_not_import_textual():
+    """Importing the package and rendering with the standalone functions must not import Textual."""
+    code = (
+        "import sys; import textual_pyfiglet; from textual_pyfiglet import figlet_quick, render_lines; "
+        "figlet_quick('hi'); render_lines('hi'); print('textual' in sys.modules)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    assert output.strip() == "False"
+
+
+def test_render_lines_matches_widget():
+    widget = FigletWidget("Hello", font="slant", justify="left")
+    widget.figlet.width = 80
+    trim = bool(widget.styles.width and widget.styles.width.is_auto)
+    assert render_lines("Hello", font="slant", width=80, justify="left", trim=trim) == widget.render_figlet(
+        "Hello"
+    )
+
+
+@pytest.mark.parametrize("font", ["standard", "slant", "smblock", "mirror"])
+@pytest.mark.parametrize("width", [30, 80])
+def test_incremental_render_matches_pyfiglet(font: str, width: int):
+    """Typing one character at a time (including wrapping, newlines, and backspaces)
+    gives the same output as a full render."""
+    figlet = CustomFiglet(font=font, width=width, justify="center")
+    reference = Figlet(font=font, width=width, justify="center")
+    incremental = IncrementalRenderer()
+
+    text = ""
+    for char in "Hello, World!\nThis line wraps around |/\\_ [x]\b\b more":
+        text = text[:-1] if char == "\b" else text + char
+        assert incremental.render(figlet, text) == str(reference.renderText(text))
+
+
+def test_incremental_render_resumes():
+    figlet = CustomFiglet(font="standard", width=80)
+    incremental = IncrementalRenderer()
+    incremental.render(figlet, "Hello")
+    builder = incremental._builder
+    incremental.render(figlet, "Hello World")
+    assert incremental._builder is builder  # Continued from the previous render.
+
+    figlet.setFont(font="slant")
+    incremental.render(figlet, "Hello World!")
+    assert incremental._builder is not builder  # Font changed, so it started over.
+
+
+def test_incremental_render_only_renders_changed_lines(monkeypatch):
+    figlet = CustomFiglet(font="standard", width=80, justify="left")
+    incremental = IncrementalRenderer()
+    lines = ["first", "", "second", "third"]
+    assert incremental.render(figlet, "\n".join(lines)) == str(figlet.renderText("\n".join(lines)))
+
+    rendered = record_calls(monkeypatch, IncrementalRenderer, "_render_line", arg=2)
+    lines[2] = "2nd"
+    assert incremental.render(figlet, "\n".join(lines)) == str(figlet.renderText("\n".join(lines)))
+    assert rendered == ["2nd\n"]
+
+
+async def test_coalesce_update_policy(rendered: "list[str]"):
+    """A burst of updates is rendered once, and the final value is the one that is shown."""
+
+    class CoalesceApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield FigletWidget("start", update_policy="coalesce", max_latency=0.05)
+
+    app = CoalesceApp()
+    async with app.run_test() as pilot:
+        widget = app.query_one(FigletWidget)
+        await pilot.pause(0.1)
+        rendered.clear()
+
+        for i in range(200):
+            widget.update(f"status {i}")
+        assert rendered == []
+
+        await pilot.pause(0.1)
+        assert set(rendered) == {"status 199"}  # (A resize from the new size can render it again.)
+        expected = figlet_format("status 199", font="standard", width=widget.figlet.width, justify="center")
+        assert widget.figlet_render == expected
+
+
+async def test_render_in_thread():
+    """Renders happen in a worker thread, and only the latest one is shown."""
+
+    class ThreadApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield FigletWidget("start", font="banner3-D", render_in_thread=True)
+
+    app = ThreadApp()
+    async with app.run_test() as pilot:
+        widget = app.query_one(FigletWidget)
+        await pilot.pause()
+        before = widget.figlet_render
+
+        for text in ["one", "two", "three"]:
+            widget.update(text)
+        assert widget.figlet_render == before  # Still showing the previous render.
+
+        expected = figlet_format("three", font="banner3-D", width=widget.figlet.width, justify="center")
+        for _ in range(100):
+            await pilot.pause(0.02)
+            if widget.figlet_render != before:
+                break
+        assert widget.figlet_render == expected
+
+
+def test_skip_render_when_nothing_changed(monkeypatch, rendered: "list[str]"):
+    widget = FigletWidget("Hello", font="slant")
+    rendered.clear()  # The first render.
+    messages: list[object] = []
+    monkeypatch.setattr(widget, "post_message", messages.append)
+
+    widget.text_input = "Hello"
+    assert rendered == []
+    assert len(messages) == 1  # Updated is still posted.
+
+    widget.figlet.width = 40  # What refresh_size does when the width changes.
+    widget.text_input = "Hello"
+    assert rendered == ["Hello"]
+
+
+async def test_batch_update_renders_once(monkeypatch, rendered: "list[str]"):
+
+    class BatchApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield FigletWidget("start")
+
+    app = BatchApp()
+    async with app.run_test() as pilot:
+        widget = app.query_one(FigletWidget)
+        await pilot.pause()
+        updates: list[object] = []
+        post_message = widget.post_message
+        monkeypatch.setattr(
+            widget,
+            "post_message",
+            lambda message: (updates.append(message) if isinstance(message, FigletWidget.Updated) else None)
+            or post_message(message),
+        )
+        rendered.clear()
+
+        with widget.batch_update():
+            widget.font = "slant"
+            widget.justify = "left"
+            widget.update("batched")
+        assert rendered == ["batched"]
+        assert len(updates) == 1
+
+        widget.configure(text="configured", font="small", justify="right")
+        assert rendered == ["batched", "configured"]
+        assert len(updates) == 2
+        assert widget.figlet_render == figlet_format(
+            "configured", font="small", justify="right", width=widget.figlet.width
+        )
+
+        with pytest.raises(ValueError, match="Invalid font"):
+            widget.configure(text="broken", font="not a font")  # type: ignore[arg-type]
+        with pytest.raises(RuntimeError):
+            with widget.batch_update():
+                widget.justify = "left"
+                widget.font = "slant"
+                widget.update("changed")
+                raise RuntimeError
+        assert rendered == ["batched", "configured"]  # Failed batches do not render.
+        assert len(updates) == 2
+        assert widget._batch_depth == 0 and not widget._batch_pending
+        # The settings are rolled back, so the widget's state matches what is shown.
+        assert (widget.text_input, widget.font, widget.justify) == ("configured", "small", "right")
+        assert widget.figlet_render == figlet_format(
+            widget.text_input, font=widget.font, justify=widget.justify, width=widget.figlet.width
+        )
+        widget.update("after")
+        assert rendered[-1] == "after"
+        assert widget.figlet_render == figlet_format(
+            "after", font="small", justify="right", width=widget.figlet.width
+        )
+
+
+@pytest.mark.parametrize(
+    "lines, trim, expected",
+    [
+        (["   ", "  ab ", "", "   c", "  "], True, ["ab", "", " c"]),
+        (["   ", "  ab ", "", "   c", "  "], False, ["  ab ", "", "   c"]),
+        (["    ", "", " "], True, [""]),
+        ([], False, [""]),
+    ],
+)
+def test_trim_render(lines: list[str], trim: bool, expected: list[str]):
+    assert trim_render(lines, trim) == expected
+
+
+async def test_render_async_deduplicates(monkeypatch):
+    calls = record_calls(monkeypatch, renderer, "render_lines")
+
+    results = await asyncio.gather(
+        *[FigletWidget.render_async("async", font="slant") for _ in range(10)],
+        FigletWidget.render_async("other", font="slant"),
+    )
+    assert calls.count("async") == 1
+    assert calls.count("other") == 1
+    assert all(lines == render_lines("async", font="slant") for lines in results[:10])
+    assert results[0] is not results[1]  # Every caller gets its own list.
+    assert renderer._in_flight == {}
+
+
+def test_render_many_in_order():
+    jobs = [(f"item {i}", font, 60, "center") for i in range(6) for font in ("slant", "standard", "small")]
+    progress: list[tuple[int, int]] = []
+
+    results = list(
+        render_many(jobs, workers=2, chunksize=4, progress=lambda done, total: progress.append((done, total)))
+    )
+
+    assert results == [
+        figlet_format(text, font=font, width=width, justify=justify) for text, font, width, justify in jobs
+    ]
+    assert progress[-1] == (len(jobs), len(jobs))
+
+
+def test_render_many_validates_at_the_call():
+    with pytest.raises(ValueError, match="workers"):
+        render_many([("a", "standard", 80, "left")], workers=0)  # Not iterated.
+    with pytest.raises(ValueError, match="chunksize"):
+        render_many([("a", "standard", 80, "left")], chunksize=0)
+    assert list(render_many([])) == []
+
+
+def test_disk_cache_round_trip_and_eviction(tmp_path):
+    cache = DiskRenderCache(tmp_path, max_bytes=1000)
+    keys = [(f"text {i}", "standard", 80, "left", "left-to-right", True) for i in range(3)]
+    cache.put(keys[0], "x" * 300)
+    assert cache.get(keys[0]) == "x" * 300
+    assert cache.get(keys[0][:5] + (False,)) == "x" * 300  # The trim setting is not part of the key.
+    assert cache.get(keys[1]) is None
+
+    # A second cache on the same directory (like another process) sees the same renders.
+    other = DiskRenderCache(tmp_path, max_bytes=1000)
+    other.put(keys[1], "1" * 300)
+    for i, key in enumerate(keys[:2]):
+        os.utime(other._path(key), (i * 10, i * 10))
+    assert other.get(keys[0]) == "x" * 300  # Reading makes it the most recently used.
+    other.put(keys[2], "2" * 300)  # Over the limit, the least recently used is evicted.
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == "x" * 300
+    assert cache.get(keys[2]) == "2" * 300
+    assert other.size() <= 1000
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_widget_warm_start_from_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(FigletWidget, "disk_cache", DiskRenderCache(tmp_path))
+    monkeypatch.setattr(FigletWidget, "render_cache", RenderCache())
+    expected = FigletWidget("warm start", font="slant").figlet_render
+
+    # Simulate a restart: empty memory cache, and Pyfiglet must not be called.
+    monkeypatch.setattr(FigletWidget, "render_cache", RenderCache())
+    monkeypatch.setattr(IncrementalRenderer, "render", lambda *args: pytest.fail("Pyfiglet was called"))
+    assert FigletWidget("warm start", font="slant").figlet_render == expected
+
+
+def test_atomic_write(tmp_path):
+    path = tmp_path / "file"
+    atomic_write(path, b"first", mode=0o644)
+    atomic_write(path, b"second")
+    assert path.read_bytes() == b"second"
+    assert os.listdir(tmp_path) == ["file"]  # No temporary files are left behind.
+
+    with pytest.raises(OSError):
+        atomic_write(tmp_path / "missing" / "file", b"data")
+
+
+def test_font_index_round_trip(tmp_path):
+    path = tmp_path / "fonts.index"
+    assert build_index(path, fonts=["standard", "slant", "smmono9"]) == 3
+
+    index = FontIndex(path)
+    assert index.names() == ["standard", "slant", "smmono9"]
+    for font in index.names():
+        assert index.info(font) == FontInfo.from_glyph_table(GlyphTable.load(font))
+
+    standard = index.info("standard")
+    assert (standard.height, standard.baseline, standard.print_direction) == (6, 5, 0)
+    assert standard.covers("Hello 123\nÄÖÜ") and not standard.covers("☺")
+    assert index.info("smmono9").covers("☺")
+    assert index.fonts_covering("☺") == ["smmono9"]
+
+    path.write_bytes(b"TPFP" + bytes(20))
+    with pytest.raises(FontIndexError):
+        FontIndex(path)
+
+
+@pytest.mark.parametrize("font", ["standard", "slant", "big", "mirror", "banner3", "stronger_than_all"])
+@pytest.mark.parametrize("text", ["Hello, World!", "a/b\\c_|_(x)", "two\n\nlines", ""])
+def test_natural_width_matches_render(font: str, text: str):
+    figlet = CustomFiglet(font=font, width=100_000, justify="left")
+    lines = str(figlet.renderText(text)).split("\n")
+    widest_char = max([figlet.Font.width.get(ord(char), 0) for char in text], default=0)
+    expected = max(max(len(line) for line in lines), widest_char - 1)
+    assert natural_width(text, figlet.Font, figlet.direction) == expected
+
+
+async def test_fit_auto_picks_widest_font_that_fits():
+
+    fonts = ["big", "standard", "small", "mini"]
+
+    class FitApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield FigletWidget("Fit me", fit="auto", fit_fonts=fonts)
+
+    app = FitApp()
+    async with app.run_test(size=(120, 20)) as pilot:
+        widget = app.query_one(FigletWidget)
+        widths = {font: natural_width("Fit me", font_registry.get(font)) for font in fonts}
+        for size in (120, 31, 25, 12):
+            await pilot.resize_terminal(size, 20)
+            await pilot.pause()
+            fitting = [font for font in fonts if widths[font] < widget.figlet.width]
+            expected = max(fitting, key=widths.__getitem__) if fitting else "mini"
+            assert widget.fitted_font == expected
+            assert widget.figlet.font == expected
+
+        widget.fit = "none"
+        await pilot.pause()
+        assert widget.fitted_font == widget.figlet.font == "standard"
+
+
+@pytest.mark.parametrize(
+    "font", ["standard", "slant", "big", "banner3", "mirror", "stronger_than_all", "smmono9"]
+)
+@pytest.mark.parametrize("text", ["Hello, World! This text wraps.", "a/b\\c_|_(x)", "two\n\nlines", " ", ""])
+@pytest.mark.parametrize("width", [20, 80, None])
+@pytest.mark.parametrize("justify, trim", [("left", True), ("center", False), ("right", False)])
+def test_measure_matches_render(font: str, text: str, width: "int | None", justify: str, trim: bool):
+    if width is None:
+        figlet = CustomFiglet(font=font, justify="left")
+        width = natural_width(text, figlet.Font, figlet.direction) + 1
+        assert measure(text, font, None, justify, trim) == measure(text, font, width, justify, trim)  # type: ignore[arg-type]
+    lines = render_lines(text, font, width, justify, trim)  # type: ignore[arg-type]
+    assert measure(text, font, width, justify, trim) == (max(len(line) for line in lines), len(lines))  # type: ignore[arg-type]
+
+
+async def test_widget_measure():
+
+    class MeasureApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield FigletWidget("Measure me", font="slant")
+
+    app = MeasureApp()
+    async with app.run_test(size=(40, 20)) as pilot:
+        await pilot.pause()
+        widget = app.query_one(FigletWidget)
+        assert widget.measure_text() == (
+            max(len(line) for line in widget._animation_lines),
+            len(widget._animation_lines),
+        )
+        lines = render_lines("Other", "slant", widget.figlet.width, "center")
+        assert widget.measure_text("Other") == (max(len(line) for line in lines), len(lines))
+    assert FigletWidget.measure("Measure me", "slant") == measure("Measure me", "slant", None)
+
+
+def test_measure_defaults_agree():
+    text = "A line that is much wider than eighty columns"
+    unwrapped = measure(text, "slant")
+    assert FigletWidget.measure(text, "slant") == unwrapped
+    assert unwrapped == measure(text, "slant", None)
+    assert unwrapped.width > 80 and unwrapped.height < measure(text, "slant", 80).height
+
+
+async def test_static_strips_are_cached(styled: "list[object]"):
+
+    class StaticApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield FigletWidget("Static", colors=["red", "blue"], horizontal=True)
+
+    app = StaticApp()
+    async with app.run_test(size=(60, 20)) as pilot:
+        await pilot.pause()
+        widget = app.query_one(FigletWidget)
+        styled.clear()
+        for _ in range(3):
+            rendered = [widget.render_line(y) for y in range(widget.size.height + 2)]
+        assert styled == []  # Built once, when the widget was painted.
+        assert [cells(strip) for strip in rendered] == [
+            cells(Coloromatic.render_line(widget, y)) for y in range(widget.size.height + 2)
+        ]
+
+        for change in ({"horizontal": False}, {"color_list": ["green"]}, {"text_input": "Other"}):
+            for name, value in change.items():
+                setattr(widget, name, value)
+            await pilot.pause()
+            styled.clear()
+            rendered = [widget.render_line(y) for y in range(widget.size.height)]
+            assert styled == []
+            assert [cells(strip) for strip in rendered] == [
+                cells(Coloromatic.render_line(widget, y)) for y in range(widget.size.height)
+            ]
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"animation_type": "gradient", "horizontal": True},
+        {"animation_type": "gradient", "reverse": True},
+        {"animation_type": "smooth_strobe"},
+    ],
+)
+async def test_animation_frame_cycle(styled: "list[object]", settings: dict[str, object]):
+
+    class AnimatedApp(App[None]):
+        def compose(self) -> ComposeResult:
+            # A low fps so the timer does not advance the animation during the test.
+            yield FigletWidget("Cycle", colors=["red", "blue"], animate=True, fps=0.1, **settings)  # type: ignore[arg-type]
+
+    app = AnimatedApp()
+    async with app.run_test(size=(60, 20)) as pilot:
+        await pilot.pause()
+        widget = app.query_one(FigletWidget)
+        colors = widget._line_colors
+        height = widget.size.height
+        styled.clear()
+
+        for tick in range(2 * len(colors) + 1):
+            if tick == len(colors):
+                assert len(styled) == len(colors) - 1  # Frame 0 was built when the widget was painted.
+            rendered = [widget.render_line(y) for y in range(height)]
+            widget._line_colors = deque(colors)  # What the Coloromatic would display.
+            widget._line_colors.rotate(widget._frame_phase)
+            assert [cells(strip) for strip in rendered] == [
+                cells(Coloromatic.render_line(widget, y)) for y in range(height)
+            ]
+            widget._line_colors = colors
+            widget.automatic_refresh()
+        assert len(styled) == len(colors) - 1  # The second cycle is played from the frames.
+
+
+async def test_animation_pauses_while_hidden():
+
+    class HiddenApp(App[None]):
+        def compose(self) -> ComposeResult:
+            with ScrollableContainer():
+                yield FigletWidget("Hidden", id="paused", colors=["red", "blue"], animate=True, fps=0.1)
+                yield FigletWidget(
+                    "Always",
+                    id="always",
+                    colors=["red", "blue"],
+                    animate=True,
+                    fps=0.1,
+                    pause_when_hidden=False,
+                )
+                yield Static("\n" * 100)
+
+    app = HiddenApp()
+    async with app.run_test(size=(60, 20)) as pilot:
+        await pilot.pause()
+        widget = app.query_one("#paused", FigletWidget)
+        always = app.query_one("#always", FigletWidget)
+        widget.automatic_refresh()
+        assert widget._frame_phase == 1 and widget.auto_refresh is not None
+
+        container = app.query_one(ScrollableContainer)
+        container.scroll_end(animate=False)
+        await pilot.pause()
+        for figlet in (widget, always):
+            figlet.automatic_refresh()
+        assert widget._frame_phase == 1 and widget.auto_refresh is None  # Paused.
+        assert always._frame_phase == 1 and always.auto_refresh is not None
+
+        paused_at, interval = widget._paused_at  # type: ignore[misc]
+        widget._paused_at = (paused_at - 2.5 * interval, interval)  # As if it was hidden for 2.5 frames.
+        container.scroll_home(animate=False)
+        await pilot.pause()
+        await pilot.pause()  # The screen is refreshed after the scroll.
+        assert widget._frame_phase == 3 and widget.auto_refresh == interval  # Resumed in phase.
+
+        app.push_screen(Screen())
+        await pilot.pause()
+        widget.automatic_refresh()
+        assert widget.auto_refresh is None
+        app.pop_screen()
+        await pilot.pause()
+        assert widget.auto_refresh == interval
+
+        modal = ModalScreen[None]()
+        await app.push_screen(modal)
+        await modal.mount(Static("Small", id="small"))
+        await pilot.pause()
+        assert widget.can_be_seen()  # The modal screen is see-through.
+        modal.query_one("#small").styles.background = "red"
+        modal.query_one("#small").styles.height = "100%"
+        await pilot.pause()
+        assert not widget.can_be_seen()  # Completely covered by an opaque widget.
+        app.pop_screen()
+        await pilot.pause()
+
+        widget.display = False
+        await pilot.pause()
+        widget.automatic_refresh()
+        assert widget.auto_refresh is None
+        widget.display = True
+        await pilot.pause()
+        assert widget.auto_refresh == interval
+
+
+async def test_can_be_seen_without_compositor(monkeypatch):
+
+    class HiddenApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield FigletWidget("Hidden", colors=["red", "blue"], animate=True, fps=0.1)
+
+    app = HiddenApp()
+    async with app.run_test(size=(60, 20)) as pilot:
+        await pilot.pause()
+        widget = app.query_one(FigletWidget)
+        interval = widget.auto_refresh
+        widget.display = False
+        await pilot.pause()
+        assert not widget.can_be_seen()
+
+        # As if a Textual version no longer had the private compositor: keep animating.
+        monkeypatch.delattr(widget.screen, "_compositor")
+        assert widget.can_be_seen()
+        monkeypatch.undo()  # Textual itself needs it.
+
+        class OtherCompositor:  # A compositor without `visible_widgets`.
+            def __init__(self, compositor: object) -> None:
+                self.compositor = compositor
+
+            def __getattr__(self, name: str) -> object:
+                if name == "visible_widgets":
+                    raise AttributeError(name)
+                return getattr(self.compositor, name)
+
+        monkeypatch.setattr(widget.screen, "_compositor", OtherCompositor(widget.screen._compositor))
+        widget.automatic_refresh()
+        assert widget._frame_phase == 1 and widget.auto_refresh == interval
+        monkeypatch.undo()
+
+
+async def test_shared_animation_clock():
+
+    class ClockApp(App[None]):
+        def compose(self) -> ComposeResult:
+            for fps in (12, 8, 1):
+                yield FigletWidget("Tick", font="small", colors=["red", "blue"], animate=True, fps=fps)
+
+    app = ClockApp()
+    async with app.run_test(size=(60, 30)) as pilot:
+        await pilot.pause()
+        widgets = list(app.query(FigletWidget))
+        clock = AnimationClock.for_app(app)
+        assert clock.tick_fps == 24
+        assert [clock.divisor(widget) for widget in widgets] == [2, 3, 24]
+        assert all(widget._auto_refresh_timer is None for widget in widgets)  # No timer of their own.
+
+        phases = [widget._frame_phase for widget in widgets]
+        for _ in range(24):  # One second of ticks.
+            clock.tick()
+        assert [widget._frame_phase - phase for widget, phase in zip(widgets, phases)] == [12, 8, 1]
+
+        widgets[0].animated = False
+        assert clock.divisor(widgets[0]) is None and clock.tick_fps == 8
+        await widgets[1].remove()
+        assert clock.tick_fps == 1
+        widgets[2].animated = False
+        assert clock.tick_fps == 0 and clock._timer is None
+
+
+async def test_animation_clock_lets_apps_be_collected():
+
+    class ClockApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield FigletWidget("Tick", font="small", colors=["red", "blue"], animate=True)
+
+    apps: list["weakref.ref[ClockApp]"] = []
+    for _ in range(3):
+        app = ClockApp()
+        async with app.run_test(size=(60, 30)) as pilot:
+            await pilot.pause()
+            assert AnimationClock.for_app(app).tick_fps > 0
+        apps.append(weakref.ref(app))
+        del app
+    gc.collect()
+    assert apps[0]() is None and apps[1]() is None  # Textual may still hold on to the last app.
+
+
+def test_compact_segments():
+
+    red, blue = Style(color="red"), Style(color="blue")
+    underline = Style(color="red", underline=True)
+    pieces = [(" ", red), ("a", red), ("b", red), (" ", blue), (" ", red), ("c", blue), ("  d ", red)]
+    assert strips.compact_segments(pieces) == [
+        Segment(" ab  ", red),
+        Segment("c  ", blue),
+        Segment("d ", red),
+    ]
+    assert strips.compact_segments([("  ", red), (" ", blue)]) == [Segment("   ", Style())]
+    assert strips.compact_segments([(" a", underline), (" ", underline)]) == [Segment(" a ", underline)]
+    assert strips.compact_segments([("a", red), (" ", blue)], keep_spaces=True) == [
+        Segment("a", red),
+        Segment(" ", blue),
+    ]
+
+
+async def test_css_text_style_keeps_space_styles():
+    """An underline from CSS is drawn in the foreground color, so spaces keep their color."""
+
+    class UnderlineApp(App[None]):
+        CSS = "FigletWidget { text-style: underline; }"
+
+        def compose(self) -> ComposeResult:
+            yield FigletWidget("Hi Ho", colors=["red", "blue"], horizontal=True)
+
+    def styled_cells(strip: Strip) -> "list[tuple[str, Style | None]]":
+        return [(char, segment.style) for segment in strip for char in segment.text]
+
+    app = UnderlineApp()
+    async with app.run_test(size=(60, 20)) as pilot:
+        await pilot.pause()
+        widget = app.query_one(FigletWidget)
+        height = len(widget._animation_lines)
+        assert widget._keep_spaces
+        assert [styled_cells(widget.render_line(y)) for y in range(height)] == [
+            styled_cells(Coloromatic.render_line(widget, y)) for y in range(height)
+        ]
+        underlined = sum(len(widget.render_line(y)) for y in range(height))
+
+        widget.styles.text_style = "none"
+        await pilot.pause()
+        assert not widget._keep_spaces
+        assert sum(len(widget.render_line(y)) for y in range(height)) < underlined
+
+
+async def test_frame_bytes_are_reduced():
+
+    class BytesApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield FigletWidget("Bytes", colors=["red", "blue"], horizontal=True)
+
+    app = BytesApp()
+    async with app.run_test(size=(60, 20)) as pilot:
+        await pilot.pause()
+        widget = app.query_one(FigletWidget)
+        for horizontal in (True, False):
+            widget.horizontal = horizontal
+            await pilot.pause()
+            lines = range(widget.size.height)
+            before = strips.frame_bytes(Coloromatic.render_line(widget, y) for y in lines)
+            if horizontal:
+                assert widget.frame_bytes() < before * 0.8
+            else:
+                assert widget.frame_bytes() <= before  # Already one segment per line.
+
+
+async def test_animation_repaints_changed_lines():
+
+    class LinesApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield FigletWidget("Hi\n\nHo", colors=["red", "blue"], animate=True, fps=0.1)
+
+    app = LinesApp()
+    async with app.run_test(size=(60, 30)) as pilot:
+        await pilot.pause()
+        widget = app.query_one(FigletWidget)
+        height = len(widget._animation_lines)
+        regions: list[Region] = []
+        widget.refresh = lambda *args, **kwargs: regions.extend(args) or widget  # type: ignore[method-assign]
+
+        for _ in range(3):
+            before = [cells(widget.render_line(y)) for y in range(height)]
+            regions.clear()
+            widget.automatic_refresh()
+            after = [cells(widget.render_line(y)) for y in range(height)]
+            changed = {y for y in range(height) if before[y] != after[y]}
+            repainted = {y for region in regions for y in range(region.y, region.bottom)}
+            assert all(region.x == 0 and region.width == widget.size.width for region in regions)
+            assert repainted == changed
+            assert 0 < len(changed) < height  # The lines of spaces between the two blocks do not change.
+
+
+def test_bench_command_and_baseline(tmp_path, capsys):
+    output = tmp_path / "bench.json"
+    assert bench_cli.main(["--quick", "--only", "trim,animation", "--output", str(output)]) == 0
+    results = json.loads(output.read_text())
+    assert set(results["results"]) == {"trim", "animation"}
+    assert results["metadata"]["quick"] is True
+    assert all(value > 0 for group in results["results"].values() for value in group["values"].values())
+
+    baseline = json.loads(output.read_text())
+    assert bench_cli.compare(results, baseline) == []
+    for group in baseline["results"].values():
+        group["values"] = {name: value / 2 for name, value in group["values"].items()}
+    regressions = bench_cli.compare(results, baseline, threshold=0.5)
+    assert len(regressions) == sum(len(group["values"]) for group in results["results"].values())
+    assert all(regression.change == pytest.approx(1.0) for regression in regressions)
+
+    with pytest.raises(SystemExit):
+        bench_cli.main(["--only", "nope"])
+    assert "unknown suite: nope" in capsys.readouterr().err
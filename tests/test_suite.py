@@ -2,6 +2,7 @@ from typing import cast
 from pathlib import Path
 from textual.pilot import Pilot
 from textual_pyfiglet.demo import TextualPyFigletDemo
+from textual_pyfiglet.demo.gallery import FontGalleryScreen, gallery_cache_path, load_previews
 
 DEMO_DIR = Path(__file__).parent.parent / "src" / "textual_pyfiglet" / "demo"
 TERINAL_SIZE = (110, 36)
@@ -80,4 +81,27 @@ def test_snapshot_colors_horizontal(snap_compare):
         DEMO_DIR / "main.py",
         terminal_size=TERINAL_SIZE,
         run_before=run_before,
-    )        
\ No newline at end of file
+    )        
+
+
+async def test_font_gallery(tmp_path, monkeypatch):
+    """The gallery renders every font in the background, saves the previews,
+    and selecting a preview sets the font."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(FontGalleryScreen, "previews", {})
+
+    app = TextualPyFigletDemo()
+    async with app.run_test(size=TERINAL_SIZE) as pilot:
+        await pilot.press("f2")
+        gallery = cast(FontGalleryScreen, app.screen)
+        for _ in range(200):
+            await pilot.pause(0.05)
+            if gallery.shown == len(gallery.fonts):
+                break
+        assert gallery.shown == len(gallery.fonts)
+
+        await pilot.press("down", "enter")
+        await pilot.pause()
+        assert app.figlet_widget.font == gallery.fonts[0]
+
+    assert load_previews(gallery_cache_path()) == FontGalleryScreen.previews